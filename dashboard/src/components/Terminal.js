@@ -42,6 +42,8 @@ const Terminal = ({ sessionId, onClose }) => {
     // Connect WebSocket
     const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
     const ws = new WebSocket(`${protocol}//${window.location.hostname}:8000/ws/${sessionId}`);
+    ws.binaryType = 'arraybuffer';
+    const decoder = new TextDecoder();
     
     ws.onopen = () => {
       console.log('WebSocket connected');
@@ -55,7 +57,8 @@ const Terminal = ({ sessionId, onClose }) => {
     };
 
     ws.onmessage = (event) => {
-      const data = JSON.parse(event.data);
+      const text = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+      const data = JSON.parse(text);
       
       if (data.type === 'output') {
         term.write(data.data);
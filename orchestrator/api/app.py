@@ -1,40 +1,63 @@
 """FastAPI application for Container Terminal Orchestrator."""
 
+import asyncio
+import codecs
+import logging
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import anyio
+import orjson
+from fastapi import Depends, FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 
+from orchestrator.api.dependencies import get_orchestrator
 from orchestrator.core.orchestrator import Orchestrator
 from orchestrator.utils.logger import setup_logging
 from orchestrator.api.routes import containers, sessions, automation
-from orchestrator.api.websocket import WebSocketManager
+from orchestrator.api.websocket import WebSocketManager, receive_message
 
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
-# Setup logging
-setup_logging(
-    log_level=os.getenv("LOG_LEVEL", "INFO"),
-    log_format=os.getenv("LOG_FORMAT", "json")
-)
+# Terminal output is coalesced and flushed to the WebSocket every
+# WS_FLUSH_MS milliseconds, or as soon as WS_FLUSH_BYTES are pending
+WS_FLUSH_INTERVAL = float(os.getenv("WS_FLUSH_MS", "10")) / 1000.0
+WS_FLUSH_BYTES = int(os.getenv("WS_FLUSH_BYTES", "65536"))
+
+# Constant reply frames, encoded once
+_PONG_FRAME = orjson.dumps({"type": "pong"})
+
+# Worker threads available for blocking Docker calls
+API_THREADPOOL = int(os.getenv("API_THREADPOOL", "64"))
 
-# Global orchestrator instance
-orchestrator: Orchestrator = None
 ws_manager = WebSocketManager()
 
 
+def configure_logging() -> None:
+    """Setup logging from the environment."""
+    setup_logging(
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        log_format=os.getenv("LOG_FORMAT", "json")
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global orchestrator
-    
     # Startup
+    configure_logging()
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL
+    
     orchestrator = Orchestrator()
     await orchestrator.start()
+    app.state.orchestrator = orchestrator
     
     yield
     
@@ -47,9 +70,13 @@ app = FastAPI(
     title="Container Terminal Orchestrator",
     description="Python-based container orchestration platform for terminal applications",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# Set by lifespan once the orchestrator has started
+app.state.orchestrator = None
+
 # CORS configuration
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
 
@@ -61,6 +88,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger HTTP responses such as container logs (WebSockets are untouched)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(containers.router, prefix="/api/containers", tags=["containers"])
 app.include_router(sessions.router, prefix="/api/sessions", tags=["sessions"])
@@ -78,7 +108,7 @@ async def root():
 
 
 @app.get("/health")
-async def health():
+async def health(orchestrator: Orchestrator = Depends(get_orchestrator)):
     """Health check endpoint."""
     stats = orchestrator.get_system_stats() if orchestrator else {}
     
@@ -90,52 +120,122 @@ async def health():
 
 
 @app.websocket("/ws/{session_id}")
-async def websocket_endpoint(websocket: WebSocket, session_id: str):
+async def websocket_endpoint(
+    websocket: WebSocket,
+    session_id: str,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """WebSocket endpoint for terminal sessions."""
     await ws_manager.connect(websocket, session_id)
     
-    try:
-        # Get session
-        session = orchestrator.session_manager.get_session(session_id)
-        if not session:
-            await websocket.send_json({
-                "type": "error",
-                "message": f"Session {session_id} not found"
-            })
-            await ws_manager.disconnect(websocket, session_id)
-            return
+    # Get session
+    session = orchestrator.session_manager.get_session(session_id)
+    if not session:
+        await websocket.send_bytes(orjson.dumps({
+            "type": "error",
+            "message": f"Session {session_id} not found"
+        }))
+        await ws_manager.disconnect(websocket, session_id)
+        return
+        
+    # Buffer output and flush it in batches
+    pending: list[bytes] = []
+    pending_size = 0
+    data_ready = asyncio.Event()
+    buffer_full = asyncio.Event()
+    
+    # Decode incrementally so characters split across flushes stay intact
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    
+    def output_callback(data: bytes) -> None:
+        nonlocal pending_size
+        pending.append(data)
+        pending_size += len(data)
+        data_ready.set()
+        if pending_size >= WS_FLUSH_BYTES:
+            buffer_full.set()
             
-        # Add output callback
-        async def output_callback(data: str):
-            await websocket.send_json({
-                "type": "output",
-                "data": data
-            })
+    async def flush_output() -> None:
+        nonlocal pending_size
+        while True:
+            await data_ready.wait()
+            try:
+                await asyncio.wait_for(buffer_full.wait(), WS_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+                
+            data = decoder.decode(b"".join(pending))
+            pending.clear()
+            pending_size = 0
+            data_ready.clear()
+            buffer_full.clear()
             
-        session.add_output_callback(output_callback)
+            try:
+                await websocket.send_bytes(orjson.dumps({
+                    "type": "output",
+                    "data": data
+                }))
+            except Exception as e:
+                # Close the socket so the receive loop ends and cleans up
+                logger.error(f"Error sending output for session {session_id}: {e}")
+                try:
+                    await websocket.close(code=1011)
+                except Exception:
+                    pass
+                return
+                
+    flusher = asyncio.create_task(flush_output())
+    session.add_output_callback(output_callback)
+    
+    # Bind per-message lookups once
+    send_input = session.send_input
+    resize = session.resize
+    send_bytes = websocket.send_bytes
+    
+    # Message handlers keyed by message type
+    async def handle_input(data: dict) -> None:
+        send_input(data["data"])
         
+    async def handle_resize(data: dict) -> None:
+        resize(data["rows"], data["cols"])
+        
+    async def handle_ping(data: dict) -> None:
+        await send_bytes(_PONG_FRAME)
+        
+    handlers = {
+        "input": handle_input,
+        "resize": handle_resize,
+        "ping": handle_ping,
+    }
+    get_handler = handlers.get
+    
+    try:
         # Handle input
         while True:
-            data = await websocket.receive_json()
+            data = await receive_message(websocket)
             
-            if data["type"] == "input":
-                session.send_input(data["data"])
-            elif data["type"] == "resize":
-                session.resize(data["rows"], data["cols"])
-            elif data["type"] == "ping":
-                await websocket.send_json({"type": "pong"})
+            handler = get_handler(data["type"])
+            if handler:
+                await handler(data)
                 
     except WebSocketDisconnect:
+        pass
+    finally:
         session.remove_output_callback(output_callback)
+        flusher.cancel()
         await ws_manager.disconnect(websocket, session_id)
 
-
 # For running directly
 if __name__ == "__main__":
     import uvicorn
     
+    # Sessions and their PTYs live in this process, so run a single worker
     uvicorn.run(
-        app,
+        "orchestrator.api.app:app",
         host=os.getenv("API_HOST", "0.0.0.0"),
-        port=int(os.getenv("API_PORT", 8000))
+        port=int(os.getenv("API_PORT", 8000)),
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        log_level=os.getenv("LOG_LEVEL", "info").lower()
     )
\ No newline at end of file
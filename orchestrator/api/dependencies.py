@@ -0,0 +1,17 @@
+"""FastAPI dependencies."""
+
+from starlette.requests import HTTPConnection
+
+from orchestrator.core.orchestrator import Orchestrator
+
+
+def get_orchestrator(connection: HTTPConnection) -> Orchestrator:
+    """Get the orchestrator instance created at application startup.
+    
+    Args:
+        connection: Incoming HTTP or WebSocket connection
+        
+    Returns:
+        Orchestrator instance
+    """
+    return connection.app.state.orchestrator
\ No newline at end of file
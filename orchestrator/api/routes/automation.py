@@ -1,15 +1,120 @@
 """Automation API routes."""
 
-from typing import List, Dict, Any, Optional
+import functools
+import hashlib
+import re
+from string import Formatter
+from types import MappingProxyType
+from typing import List, Dict, Any, AsyncIterator, Mapping, Optional, Sequence, Tuple
 
-from fastapi import APIRouter, HTTPException
+import orjson
+import re2
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from orchestrator.api.app import orchestrator
+from orchestrator.api.dependencies import get_orchestrator
+from orchestrator.core.orchestrator import Orchestrator
+from orchestrator.terminal.pexpect_handler import PexpectHandler
 
 
 router = APIRouter()
 
+# In production, these would be loaded from files
+_TEMPLATE_DEFINITIONS: List[Dict[str, Any]] = [
+    {
+        "name": "git-clone",
+        "description": "Clone a git repository",
+        "commands": [
+            "cd /workspace",
+            "git clone {repository_url}",
+            "cd {repository_name}",
+            "ls -la"
+        ],
+        "variables": ["repository_url", "repository_name"]
+    },
+    {
+        "name": "python-setup",
+        "description": "Setup Python virtual environment",
+        "commands": [
+            "cd /workspace",
+            "python -m venv venv",
+            "source venv/bin/activate",
+            "pip install --upgrade pip",
+            "pip install -r requirements.txt"
+        ],
+        "variables": []
+    },
+    {
+        "name": "docker-build",
+        "description": "Build Docker image",
+        "commands": [
+            "cd /workspace",
+            "docker build -t {image_name}:{tag} .",
+            "docker images | grep {image_name}"
+        ],
+        "variables": ["image_name", "tag"]
+    }
+]
+
+# Templates are static, so the response body and its ETag are built once
+_TEMPLATES_BODY = orjson.dumps(_TEMPLATE_DEFINITIONS)
+_TEMPLATES_ETAG = f'"{hashlib.blake2b(_TEMPLATES_BODY, digest_size=8).hexdigest()}"'
+
+# Read-only views shared by every request
+_TEMPLATES: Tuple[Mapping[str, Any], ...] = tuple(
+    MappingProxyType({
+        **template,
+        "commands": tuple(template["commands"]),
+        "variables": tuple(template["variables"])
+    })
+    for template in _TEMPLATE_DEFINITIONS
+)
+
+
+def _parse_command(command: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a command template into (literal, variable) segments.
+    
+    Args:
+        command: Command template using str.format placeholders
+        
+    Returns:
+        Tuple of segments
+    """
+    return tuple(
+        (literal, field_name)
+        for literal, field_name, _, _ in Formatter().parse(command)
+    )
+
+
+def _render_command(
+    segments: Tuple[Tuple[str, Optional[str]], ...],
+    variables: Dict[str, str]
+) -> str:
+    """Render a parsed command template.
+    
+    Args:
+        segments: Parsed command segments
+        variables: Template variables
+        
+    Returns:
+        Rendered command
+    """
+    return "".join(
+        literal + variables[name] if name else literal
+        for literal, name in segments
+    )
+
+
+# Command templates are parsed once instead of on every execution
+_TEMPLATE_COMMANDS: Mapping[str, Tuple[Tuple[str, ...], Tuple[Any, ...]]] = MappingProxyType({
+    template["name"]: (
+        template["commands"],
+        tuple(_parse_command(command) for command in template["commands"])
+    )
+    for template in _TEMPLATES
+})
+
 
 class AutomationScriptRequest(BaseModel):
     """Automation script execution request."""
@@ -17,6 +122,7 @@ class AutomationScriptRequest(BaseModel):
     commands: List[str]
     expect_prompts: Optional[List[str]] = None
     timeout: float = 30.0
+    stream: bool = False
 
 
 class ExpectRequest(BaseModel):
@@ -27,16 +133,57 @@ class ExpectRequest(BaseModel):
 
 
 @router.post("/execute")
-async def execute_script(request: AutomationScriptRequest):
+async def execute_script(
+    request: AutomationScriptRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Execute automation script on session.
     
     Args:
         request: Script execution request
+        orchestrator: Orchestrator instance
         
     Returns:
-        Execution result
+        Execution result, or newline-delimited results when streaming
     """
-    session = orchestrator.session_manager.get_session(request.session_id)
+    if request.stream:
+        handler = _get_pexpect_handler(orchestrator, request.session_id)
+        return StreamingResponse(
+            _stream_results(
+                handler,
+                request.commands,
+                request.expect_prompts,
+                request.timeout
+            ),
+            media_type="application/x-ndjson"
+        )
+        
+    return await _run_commands(
+        orchestrator,
+        request.session_id,
+        request.commands,
+        prompts=request.expect_prompts,
+        timeout=request.timeout
+    )
+
+
+def _get_pexpect_handler(
+    orchestrator: Orchestrator,
+    session_id: str
+) -> PexpectHandler:
+    """Get the automation handler of a session.
+    
+    Args:
+        orchestrator: Orchestrator instance
+        session_id: Session ID
+        
+    Returns:
+        Pexpect handler
+        
+    Raises:
+        HTTPException: If the session is missing or has no automation
+    """
+    session = orchestrator.session_manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
         
@@ -46,61 +193,166 @@ async def execute_script(request: AutomationScriptRequest):
             detail="Session does not have automation enabled"
         )
         
+    return session.pexpect_handler
+
+
+async def _run_commands(
+    orchestrator: Orchestrator,
+    session_id: str,
+    commands: Sequence[str],
+    prompts: Optional[List[str]] = None,
+    timeout: float = 30.0
+) -> Dict[str, Any]:
+    """Run commands on an automation-enabled session.
+    
+    Args:
+        orchestrator: Orchestrator instance
+        session_id: Session ID
+        commands: Commands to execute
+        prompts: Optional prompt to wait for after each command
+        timeout: Timeout in seconds for each prompt
+        
+    Returns:
+        Execution result
+    """
+    handler = _get_pexpect_handler(orchestrator, session_id)
+    results = await _run(handler, commands, prompts, timeout)
+    
+    return {
+        "session_id": session_id,
+        "results": results
+    }
+
+
+async def _stream_results(
+    handler: PexpectHandler,
+    commands: Sequence[str],
+    prompts: Optional[List[str]],
+    timeout: float
+) -> AsyncIterator[bytes]:
+    """Run commands one at a time, yielding each result as a JSON line.
+    
+    Args:
+        handler: Pexpect handler
+        commands: Commands to execute
+        prompts: Optional prompt to wait for after each command
+        timeout: Timeout in seconds for each prompt
+        
+    Yields:
+        Encoded command results
+    """
+    for i, command in enumerate(commands):
+        result = await _run_command(handler, command, _prompt_for(prompts, i), timeout)
+        yield orjson.dumps(result) + b"\n"
+        
+        if not result["success"]:
+            break
+
+
+async def _run(
+    handler: PexpectHandler,
+    commands: Sequence[str],
+    prompts: Optional[List[str]],
+    timeout: float
+) -> List[Dict[str, Any]]:
+    """Run commands until one of them times out.
+    
+    Args:
+        handler: Pexpect handler
+        commands: Commands to execute
+        prompts: Optional prompt to wait for after each command
+        timeout: Timeout in seconds for each prompt
+        
+    Returns:
+        Command results
+    """
     results = []
     
-    try:
-        for i, command in enumerate(request.commands):
-            # Send command
-            prompt = request.expect_prompts[i] if request.expect_prompts and i < len(request.expect_prompts) else "$"
-            
-            output = session.pexpect_handler.send_command(
-                command,
-                expect_prompt=True,
-                prompt=prompt
-            )
-            
-            results.append({
-                "command": command,
-                "output": output,
-                "success": True
-            })
+    for i, command in enumerate(commands):
+        result = await _run_command(handler, command, _prompt_for(prompts, i), timeout)
+        results.append(result)
+        
+        if not result["success"]:
+            break
             
+    return results
+
+
+async def _run_command(
+    handler: PexpectHandler,
+    command: str,
+    prompt: str,
+    timeout: float
+) -> Dict[str, Any]:
+    """Send a command and wait for the prompt.
+    
+    Args:
+        handler: Pexpect handler
+        command: Command to execute
+        prompt: Prompt to wait for
+        timeout: Timeout in seconds
+        
+    Returns:
+        Command result
+    """
+    try:
+        output = await handler.send_command(
+            command,
+            expect_prompt=True,
+            prompt=prompt,
+            timeout=timeout
+        )
     except TimeoutError as e:
-        results.append({
+        return {
             "command": command,
             "output": str(e),
             "success": False
-        })
+        }
         
     return {
-        "session_id": request.session_id,
-        "results": results
+        "command": command,
+        "output": output,
+        "success": True
     }
 
 
+def _prompt_for(prompts: Optional[List[str]], index: int) -> str:
+    """Get the prompt to wait for after a command.
+    
+    Args:
+        prompts: Optional prompts, one per command
+        index: Command index
+        
+    Returns:
+        Prompt
+    """
+    return prompts[index] if prompts and index < len(prompts) else "$"
+
+
 @router.post("/expect")
-async def expect_pattern(request: ExpectRequest):
+async def expect_pattern(
+    request: ExpectRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Wait for pattern in session output.
     
     Args:
         request: Expect request
+        orchestrator: Orchestrator instance
         
     Returns:
         Match result
     """
-    session = orchestrator.session_manager.get_session(request.session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-        
-    if not session.pexpect_handler:
-        raise HTTPException(
-            status_code=400,
-            detail="Session does not have automation enabled"
-        )
+    handler = _get_pexpect_handler(orchestrator, request.session_id)
+    
+    try:
+        patterns = [_compile_pattern(pattern) for pattern in request.patterns]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
         
     try:
-        matched_index = session.pexpect_handler.expect(
-            request.patterns,
+        matched_index = await handler.expect(
+            patterns,
             timeout=request.timeout
         )
         
@@ -118,58 +370,73 @@ async def expect_pattern(request: ExpectRequest):
         }
 
 
+# Patterns RE2 can't handle (backreferences, lookaround) fall back to the
+# backtracking re module, but only up to this length
+_MAX_FALLBACK_PATTERN_LENGTH = 256
+
+_RE2_OPTIONS = re2.Options()
+_RE2_OPTIONS.log_errors = False
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Any:
+    """Compile an expect pattern, preferring RE2's linear-time matching.
+    
+    Args:
+        pattern: Regular expression from the client
+        
+    Returns:
+        Compiled bytes pattern, for matching raw terminal output
+        
+    Raises:
+        ValueError: If the pattern is invalid or unsupported
+    """
+    raw = pattern.encode()
+    try:
+        return re2.compile(raw, _RE2_OPTIONS)
+    except re2.error:
+        pass
+        
+    if len(pattern) > _MAX_FALLBACK_PATTERN_LENGTH:
+        raise ValueError(
+            f"Pattern not supported by RE2 and longer than "
+            f"{_MAX_FALLBACK_PATTERN_LENGTH} characters"
+        )
+        
+    try:
+        return re.compile(raw)
+    except re.error as e:
+        raise ValueError(f"Invalid pattern {pattern!r}: {e}")
+
+
 @router.get("/templates")
-async def list_automation_templates():
+async def list_automation_templates(request: Request):
     """List available automation templates.
     
+    Args:
+        request: Incoming request
+        
     Returns:
         List of templates
     """
-    # In production, these would be loaded from files
-    templates = [
-        {
-            "name": "git-clone",
-            "description": "Clone a git repository",
-            "commands": [
-                "cd /workspace",
-                "git clone {repository_url}",
-                "cd {repository_name}",
-                "ls -la"
-            ],
-            "variables": ["repository_url", "repository_name"]
-        },
-        {
-            "name": "python-setup",
-            "description": "Setup Python virtual environment",
-            "commands": [
-                "cd /workspace",
-                "python -m venv venv",
-                "source venv/bin/activate",
-                "pip install --upgrade pip",
-                "pip install -r requirements.txt"
-            ],
-            "variables": []
-        },
-        {
-            "name": "docker-build",
-            "description": "Build Docker image",
-            "commands": [
-                "cd /workspace",
-                "docker build -t {image_name}:{tag} .",
-                "docker images | grep {image_name}"
-            ],
-            "variables": ["image_name", "tag"]
-        }
-    ]
+    headers = {"ETag": _TEMPLATES_ETAG, "Cache-Control": "public, max-age=300"}
     
-    return templates
+    if request.headers.get("if-none-match") == _TEMPLATES_ETAG:
+        return Response(status_code=304, headers=headers)
+        
+    return Response(
+        content=_TEMPLATES_BODY,
+        media_type="application/json",
+        headers=headers
+    )
 
 
 @router.post("/templates/{template_name}/execute")
 async def execute_template(
     template_name: str,
     session_id: str,
-    variables: Optional[Dict[str, str]] = None
+    variables: Optional[Dict[str, str]] = None,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
 ):
     """Execute automation template.
     
@@ -177,43 +444,21 @@ async def execute_template(
         template_name: Template name
         session_id: Session ID
         variables: Template variables
+        orchestrator: Orchestrator instance
         
     Returns:
         Execution result
     """
-    # Get template (in production, from storage)
-    templates = {
-        "git-clone": {
-            "commands": [
-                "cd /workspace",
-                "git clone {repository_url}",
-                "cd {repository_name}",
-                "ls -la"
-            ]
-        },
-        "python-setup": {
-            "commands": [
-                "cd /workspace",
-                "python -m venv venv",
-                "source venv/bin/activate",
-                "pip install --upgrade pip",
-                "pip install -r requirements.txt"
-            ]
-        }
-    }
-    
-    if template_name not in templates:
+    if template_name not in _TEMPLATE_COMMANDS:
         raise HTTPException(status_code=404, detail="Template not found")
         
     # Substitute variables
-    commands = templates[template_name]["commands"]
+    commands, parsed_commands = _TEMPLATE_COMMANDS[template_name]
     if variables:
-        commands = [cmd.format(**variables) for cmd in commands]
-        
+        try:
+            commands = [_render_command(segments, variables) for segments in parsed_commands]
+        except KeyError as e:
+            raise HTTPException(status_code=400, detail=f"Missing template variable: {e}")
+            
     # Execute
-    request = AutomationScriptRequest(
-        session_id=session_id,
-        commands=commands
-    )
-    
-    return await execute_script(request)
\ No newline at end of file
+    return await _run_commands(orchestrator, session_id, commands)
\ No newline at end of file
@@ -1,11 +1,13 @@
 """Container management API routes."""
 
-from typing import List, Dict, Any
+from typing import Dict, Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
-from orchestrator.api.app import orchestrator
+from orchestrator.api.dependencies import get_orchestrator
+from orchestrator.core.container_manager import ContainerManager
+from orchestrator.core.orchestrator import Orchestrator
 
 
 router = APIRouter()
@@ -21,25 +23,33 @@ class ContainerActionRequest(BaseModel):
     action: str  # start, stop, restart, remove
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
-async def list_containers(all: bool = Query(False, description="Include stopped containers")):
+@router.get("/")
+async def list_containers(
+    all: bool = Query(False, description="Include stopped containers"),
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """List all containers.
     
     Args:
         all: Include stopped containers
+        orchestrator: Orchestrator instance
         
     Returns:
         List of containers
     """
-    return orchestrator.container_manager.list_containers(all=all)
+    return await orchestrator.run_docker(orchestrator.container_manager.list_containers, all=all)
 
 
-@router.post("/", response_model=Dict[str, Any])
-async def create_container(request: ContainerCreateRequest):
+@router.post("/")
+async def create_container(
+    request: ContainerCreateRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Create a new container.
     
     Args:
         request: Container creation request
+        orchestrator: Orchestrator instance
         
     Returns:
         Container creation result
@@ -54,36 +64,63 @@ async def create_container(request: ContainerCreateRequest):
 
 
 @router.get("/{container_id}")
-async def get_container(container_id: str):
+async def get_container(
+    container_id: str,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Get container details.
     
     Args:
         container_id: Container ID
+        orchestrator: Orchestrator instance
         
     Returns:
         Container details
     """
     try:
-        container = orchestrator.container_manager._get_container(container_id)
-        return {
-            "id": container.id,
-            "name": container.name,
-            "image": container.image.tags[0] if container.image.tags else container.image.id,
-            "status": container.status,
-            "created": container.attrs["Created"],
-            "ports": container.attrs.get("NetworkSettings", {}).get("Ports", {}),
-        }
+        return await orchestrator.run_docker(
+            _describe_container, orchestrator.container_manager, container_id
+        )
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Container not found: {e}")
 
 
+def _describe_container(
+    container_manager: ContainerManager,
+    container_id: str
+) -> Dict[str, Any]:
+    """Build container details, querying Docker as needed.
+    
+    Args:
+        container_manager: Container manager
+        container_id: Container ID
+        
+    Returns:
+        Container details
+    """
+    container = container_manager._get_container(container_id)
+    return {
+        "id": container.id,
+        "name": container.name,
+        "image": container.image.tags[0] if container.image.tags else container.image.id,
+        "status": container.status,
+        "created": container.attrs["Created"],
+        "ports": container.attrs.get("NetworkSettings", {}).get("Ports", {}),
+    }
+
+
 @router.post("/{container_id}/action")
-async def container_action(container_id: str, request: ContainerActionRequest):
+async def container_action(
+    container_id: str,
+    request: ContainerActionRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Perform action on container.
     
     Args:
         container_id: Container ID
         request: Action request
+        orchestrator: Orchestrator instance
         
     Returns:
         Action result
@@ -92,21 +129,27 @@ async def container_action(container_id: str, request: ContainerActionRequest):
     
     try:
         if action == "stop":
-            success = orchestrator.container_manager.stop_container(container_id)
+            success = await orchestrator.run_docker(
+                orchestrator.container_manager.stop_container, container_id
+            )
             return {"success": success, "action": action}
             
         elif action == "start":
-            container = orchestrator.container_manager._get_container(container_id)
-            container.start()
-            return {"success": True, "action": action}
+            success = await orchestrator.run_docker(
+                orchestrator.container_manager.start_container, container_id
+            )
+            return {"success": success, "action": action}
             
         elif action == "restart":
-            container = orchestrator.container_manager._get_container(container_id)
-            container.restart()
-            return {"success": True, "action": action}
+            success = await orchestrator.run_docker(
+                orchestrator.container_manager.restart_container, container_id
+            )
+            return {"success": success, "action": action}
             
         elif action == "remove":
-            success = orchestrator.container_manager.remove_container(container_id)
+            success = await orchestrator.run_docker(
+                orchestrator.container_manager.remove_container, container_id
+            )
             return {"success": success, "action": action}
             
         else:
@@ -117,16 +160,22 @@ async def container_action(container_id: str, request: ContainerActionRequest):
 
 
 @router.get("/{container_id}/stats")
-async def get_container_stats(container_id: str):
+async def get_container_stats(
+    container_id: str,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Get container resource statistics.
     
     Args:
         container_id: Container ID
+        orchestrator: Orchestrator instance
         
     Returns:
         Container statistics
     """
-    stats = orchestrator.container_manager.get_container_stats(container_id)
+    stats = await orchestrator.run_docker(
+        orchestrator.container_manager.get_container_stats, container_id
+    )
     if not stats:
         raise HTTPException(status_code=404, detail="Container not found or stats unavailable")
     return stats
@@ -136,7 +185,8 @@ async def get_container_stats(container_id: str):
 async def get_container_logs(
     container_id: str,
     tail: int = Query(100, description="Number of lines to return"),
-    timestamps: bool = Query(True, description="Include timestamps")
+    timestamps: bool = Query(True, description="Include timestamps"),
+    orchestrator: Orchestrator = Depends(get_orchestrator)
 ):
     """Get container logs.
     
@@ -144,11 +194,13 @@ async def get_container_logs(
         container_id: Container ID
         tail: Number of lines to return
         timestamps: Include timestamps
+        orchestrator: Orchestrator instance
         
     Returns:
         Container logs
     """
-    logs = orchestrator.container_manager.get_container_logs(
+    logs = await orchestrator.run_docker(
+        orchestrator.container_manager.get_container_logs,
         container_id,
         tail=tail,
         timestamps=timestamps
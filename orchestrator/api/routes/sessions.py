@@ -1,11 +1,12 @@
 """Session management API routes."""
 
-from typing import List, Dict, Any, Optional
+from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
-from orchestrator.api.app import orchestrator
+from orchestrator.api.dependencies import get_orchestrator
+from orchestrator.core.orchestrator import Orchestrator
 
 
 router = APIRouter()
@@ -29,22 +30,29 @@ class SessionResizeRequest(BaseModel):
     cols: int
 
 
-@router.get("/", response_model=List[Dict[str, Any]])
-async def list_sessions():
+@router.get("/")
+async def list_sessions(orchestrator: Orchestrator = Depends(get_orchestrator)):
     """List all active sessions.
     
+    Args:
+        orchestrator: Orchestrator instance
+        
     Returns:
         List of sessions
     """
     return orchestrator.session_manager.list_sessions()
 
 
-@router.post("/", response_model=Dict[str, Any])
-async def create_session(request: SessionCreateRequest):
+@router.post("/")
+async def create_session(
+    request: SessionCreateRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Create a new terminal session.
     
     Args:
         request: Session creation request
+        orchestrator: Orchestrator instance
         
     Returns:
         Session creation result
@@ -63,34 +71,36 @@ async def create_session(request: SessionCreateRequest):
 
 
 @router.get("/{session_id}")
-async def get_session(session_id: str):
+async def get_session(
+    session_id: str,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Get session details.
     
     Args:
         session_id: Session ID
+        orchestrator: Orchestrator instance
         
     Returns:
         Session details
     """
-    session = orchestrator.session_manager.get_session(session_id)
+    session = orchestrator.session_manager.describe_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
         
-    return {
-        "session_id": session.session_id,
-        "container_id": session.container_id,
-        "created_at": session.created_at.isoformat(),
-        "last_activity": session.last_activity.isoformat(),
-        "active": session.active,
-    }
+    return session
 
 
 @router.delete("/{session_id}")
-async def close_session(session_id: str):
+async def close_session(
+    session_id: str,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Close a session.
     
     Args:
         session_id: Session ID
+        orchestrator: Orchestrator instance
         
     Returns:
         Closure result
@@ -103,12 +113,17 @@ async def close_session(session_id: str):
 
 
 @router.post("/{session_id}/input")
-async def send_input(session_id: str, request: SessionInputRequest):
+async def send_input(
+    session_id: str,
+    request: SessionInputRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Send input to session.
     
     Args:
         session_id: Session ID
         request: Input request
+        orchestrator: Orchestrator instance
         
     Returns:
         Success result
@@ -122,12 +137,17 @@ async def send_input(session_id: str, request: SessionInputRequest):
 
 
 @router.post("/{session_id}/resize")
-async def resize_session(session_id: str, request: SessionResizeRequest):
+async def resize_session(
+    session_id: str,
+    request: SessionResizeRequest,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Resize terminal session.
     
     Args:
         session_id: Session ID
         request: Resize request
+        orchestrator: Orchestrator instance
         
     Returns:
         Success result
@@ -141,12 +161,17 @@ async def resize_session(session_id: str, request: SessionResizeRequest):
 
 
 @router.get("/{session_id}/output")
-async def get_output_buffer(session_id: str, lines: Optional[int] = None):
+async def get_output_buffer(
+    session_id: str,
+    lines: Optional[int] = None,
+    orchestrator: Orchestrator = Depends(get_orchestrator)
+):
     """Get session output buffer.
     
     Args:
         session_id: Session ID
         lines: Number of lines to retrieve
+        orchestrator: Orchestrator instance
         
     Returns:
         Output buffer contents
@@ -1,20 +1,22 @@
 """WebSocket connection management."""
 
+import asyncio
 import logging
-from typing import Dict, Set
+from collections import defaultdict
+from typing import Any, Dict, List
 
-from fastapi import WebSocket
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
 
 
 logger = logging.getLogger(__name__)
 
-
 class WebSocketManager:
     """Manages WebSocket connections."""
     
     def __init__(self):
         """Initialize WebSocket manager."""
-        self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self.active_connections: Dict[str, List[WebSocket]] = defaultdict(list)
         
     async def connect(self, websocket: WebSocket, session_id: str) -> None:
         """Accept and track WebSocket connection.
@@ -25,10 +27,7 @@ class WebSocketManager:
         """
         await websocket.accept()
         
-        if session_id not in self.active_connections:
-            self.active_connections[session_id] = set()
-            
-        self.active_connections[session_id].add(websocket)
+        self.active_connections[session_id].append(websocket)
         logger.info(f"WebSocket connected for session {session_id}")
         
     async def disconnect(self, websocket: WebSocket, session_id: str) -> None:
@@ -38,12 +37,16 @@ class WebSocketManager:
             websocket: WebSocket connection
             session_id: Session ID
         """
-        if session_id in self.active_connections:
-            self.active_connections[session_id].discard(websocket)
+        connections = self.active_connections.get(session_id)
+        if connections is not None and websocket in connections:
+            # Order doesn't matter, so move the last socket into the gap
+            i = connections.index(websocket)
+            connections[i] = connections[-1]
+            connections.pop()
             
-            # Clean up empty sets
-            if not self.active_connections[session_id]:
-                del self.active_connections[session_id]
+            # Clean up empty lists
+            if not connections:
+                self.active_connections.pop(session_id, None)
                 
         logger.info(f"WebSocket disconnected for session {session_id}")
         
@@ -54,20 +57,30 @@ class WebSocketManager:
             session_id: Session ID
             message: Message to send
         """
+        # Serialize once for all connections of this session
+        await self._send_payload(session_id, orjson.dumps(message))
+        
+    async def _send_payload(self, session_id: str, payload: bytes) -> None:
+        """Send a serialized message to all connections for a session.
+        
+        Args:
+            session_id: Session ID
+            payload: Serialized message
+        """
         if session_id in self.active_connections:
-            # Send to all connections for this session
-            disconnected = []
+            sockets = list(self.active_connections[session_id])
+            
+            # Send concurrently so one slow client doesn't stall the rest
+            results = await asyncio.gather(
+                *(websocket.send_bytes(payload) for websocket in sockets),
+                return_exceptions=True
+            )
             
-            for websocket in self.active_connections[session_id]:
-                try:
-                    await websocket.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error sending to WebSocket: {e}")
-                    disconnected.append(websocket)
-                    
             # Remove disconnected sockets
-            for ws in disconnected:
-                await self.disconnect(ws, session_id)
+            for ws, result in zip(sockets, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error sending to WebSocket: {result}")
+                    await self.disconnect(ws, session_id)
                 
     async def broadcast(self, message: dict) -> None:
         """Broadcast message to all connections.
@@ -75,5 +88,25 @@ class WebSocketManager:
         Args:
             message: Message to broadcast
         """
+        payload = orjson.dumps(message)
         for session_id in list(self.active_connections.keys()):
-            await self.send_to_session(session_id, message)
\ No newline at end of file
+            await self._send_payload(session_id, payload)
+
+async def receive_message(websocket: WebSocket) -> Dict[str, Any]:
+    """Receive a JSON message sent as either a text or a binary frame.
+    
+    Args:
+        websocket: WebSocket connection
+        
+    Returns:
+        Decoded message
+        
+    Raises:
+        WebSocketDisconnect: If the client disconnected
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+        
+    payload = message.get("bytes")
+    return orjson.loads(payload if payload is not None else message["text"])
\ No newline at end of file
@@ -1,13 +1,36 @@
 """Configuration loader and management."""
 
-import json
 import os
+import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
 
+# Files modified this close to the last load are always re-read, since a
+# coarse filesystem timestamp may not reveal a quick rewrite
+_MTIME_SLACK_NS = 2_000_000_000
+
+
+def _is_fresh(cached: Optional[Tuple[int, int, int, Any]], st: os.stat_result) -> bool:
+    """Check whether a cached parse still matches the file on disk.
+    
+    Args:
+        cached: (mtime_ns, size, read_at_ns, parsed) from the last read, if any
+        st: Current stat result of the file
+        
+    Returns:
+        True if the cached parse can be reused
+    """
+    return bool(
+        cached
+        and cached[0] == st.st_mtime_ns
+        and cached[1] == st.st_size
+        and st.st_mtime_ns < cached[2] - _MTIME_SLACK_NS
+    )
+
+
 class ContainerConfig(BaseModel):
     """Container configuration model."""
     
@@ -29,6 +52,8 @@ class OrchestratorConfig(BaseModel):
     api_host: str = Field(default="0.0.0.0")
     api_port: int = Field(default=8000)
     docker_socket: str = Field(default="/var/run/docker.sock")
+    docker_pool_size: int = Field(default=64)
+    docker_workers: int = Field(default=16)
     docker_network: str = Field(default="cto_network")
     max_sessions: int = Field(default=50)
     session_timeout: int = Field(default=3600)
@@ -47,6 +72,8 @@ class ConfigLoader:
         self.config_dir = Path(config_dir or os.getenv("CTO_CONFIG_DIR", "configs"))
         self._configs: Dict[str, Any] = {}
         self._container_configs: Dict[str, ContainerConfig] = {}
+        self._file_cache: Dict[str, Tuple[int, int, int, ContainerConfig]] = {}
+        self._orchestrator_cache: Optional[Tuple[int, int, int, OrchestratorConfig]] = None
         
     def load_orchestrator_config(self) -> OrchestratorConfig:
         """Load main orchestrator configuration.
@@ -56,13 +83,22 @@ class ConfigLoader:
         """
         config_path = self.config_dir / "orchestrator.json"
         
-        if config_path.exists():
-            with open(config_path) as f:
-                data = json.load(f)
-                return OrchestratorConfig(**data)
-        
-        # Return default configuration
-        return OrchestratorConfig()
+        try:
+            st = config_path.stat()
+        except FileNotFoundError:
+            # Return default configuration
+            self._orchestrator_cache = None
+            return OrchestratorConfig()
+            
+        # Reuse the parsed config while the file is unchanged
+        cached = self._orchestrator_cache
+        if not _is_fresh(cached, st):
+            read_at = time.time_ns()
+            with open(config_path, "rb") as f:
+                config = OrchestratorConfig.model_validate_json(f.read())
+            cached = self._orchestrator_cache = (st.st_mtime_ns, st.st_size, read_at, config)
+            
+        return cached[3]
     
     def load_container_configs(self) -> Dict[str, ContainerConfig]:
         """Load all container configurations.
@@ -70,18 +106,32 @@ class ConfigLoader:
         Returns:
             Dictionary of container configurations
         """
-        containers_dir = self.config_dir / "containers"
-        
-        if not containers_dir.exists():
+        # Let scandir report a missing directory instead of stat'ing it first
+        try:
+            entries = os.scandir(self.config_dir / "containers")
+        except FileNotFoundError:
             return {}
         
         configs = {}
-        for config_file in containers_dir.glob("*.json"):
-            with open(config_file) as f:
-                data = json.load(f)
-                config = ContainerConfig(**data)
-                configs[config.name] = config
+        file_cache = {}
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                    
+                # Reuse the parsed config while the file is unchanged
+                st = entry.stat()
+                cached = self._file_cache.get(entry.path)
+                if not _is_fresh(cached, st):
+                    read_at = time.time_ns()
+                    with open(entry.path, "rb") as f:
+                        config = ContainerConfig.model_validate_json(f.read())
+                    cached = (st.st_mtime_ns, st.st_size, read_at, config)
+                    
+                file_cache[entry.path] = cached
+                configs[cached[3].name] = cached[3]
                 
+        self._file_cache = file_cache
         self._container_configs = configs
         return configs
     
@@ -103,4 +153,8 @@ class ConfigLoader:
         """Reload all configurations from disk."""
         self._configs.clear()
         self._container_configs.clear()
+        
+        # An explicit reload re-parses every file
+        self._file_cache.clear()
+        self._orchestrator_cache = None
         self.load_container_configs()
\ No newline at end of file
@@ -1,9 +1,17 @@
 """Container lifecycle management."""
 
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Set, Tuple, Union
 
 import docker
+import orjson
 from docker.models.containers import Container
 from docker.errors import NotFound, APIError
 
@@ -12,20 +20,154 @@ from orchestrator.core.config_loader import ContainerConfig
 
 logger = logging.getLogger(__name__)
 
+# dockerd serializes container setup, and older daemons fail outright
+# when too many creates run at once
+MAX_CONCURRENT_CREATES = 10
+
+# Each stats stream holds a daemon connection open; containers beyond this
+# many are sampled on demand instead
+MAX_STATS_STREAMS = 32
+
+# Lines kept per followed container; longer tails are fetched from dockerd
+LOG_RING_LINES = 1000
+
+# Each log follower holds a daemon connection open; logs of containers
+# beyond this many are fetched from dockerd
+MAX_LOG_STREAMS = 32
+
+# The only parts of a stats sample _compute_stats reads; blkio, pids and
+# storage stats are dropped as soon as a sample is parsed
+_STATS_FIELDS = ("cpu_stats", "precpu_stats", "memory_stats", "networks")
+
+# Field pairs read from every stats sample
+_get_memory = itemgetter("usage", "limit")
+_get_traffic = itemgetter("rx_bytes", "tx_bytes")
+
+
+@dataclass
+class ContainerSummary:
+    """Parsed listing entry of a container.
+    
+    Everything but the status is fixed for the life of a container, so a
+    summary is built once per container and only its status is refreshed.
+    """
+    
+    __slots__ = ("id", "name", "image", "created", "status")
+    
+    id: str
+    name: str
+    image: str
+    created: str
+    status: str
+    
+    @classmethod
+    def from_api(
+        cls,
+        container: Dict[str, Any],
+        image_tags: Dict[str, str]
+    ) -> "ContainerSummary":
+        """Build a summary from a container entry of the Docker list endpoint.
+        
+        The list endpoint only reports the creation time to the second, so
+        `created` has no fractional part.
+        
+        Args:
+            container: Container entry as returned by the low-level API
+            image_tags: First tag of each image, keyed by image ID
+            
+        Returns:
+            Container summary
+        """
+        names = container.get("Names") or []
+        created = datetime.fromtimestamp(container["Created"], timezone.utc)
+        image_id = container["ImageID"]
+        
+        return cls(
+            id=container["Id"],
+            name=names[0].lstrip("/") if names else "",
+            # First tag of the image, or its ID when untagged
+            image=image_tags.get(image_id, image_id),
+            created=created.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            status=container["State"],
+        )
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the summary as a plain dictionary.
+        
+        Returns:
+            Container information
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "image": self.image,
+            "status": self.status,
+            "created": self.created,
+        }
+
 
 class ContainerManager:
     """Manages Docker container lifecycle operations."""
     
-    def __init__(self, docker_socket: Optional[str] = None):
+    # Shared by all managers, since they all talk to the same daemon
+    _create_slots = threading.BoundedSemaphore(MAX_CONCURRENT_CREATES)
+    
+    def __init__(
+        self,
+        docker_socket: Optional[str] = None,
+        client: Optional[docker.DockerClient] = None,
+        max_stats_streams: int = MAX_STATS_STREAMS,
+        max_log_streams: int = MAX_LOG_STREAMS
+    ):
         """Initialize container manager.
         
         Args:
             docker_socket: Path to Docker socket
+            client: Optional shared Docker client
+            max_stats_streams: Maximum concurrent stats streams
+            max_log_streams: Maximum concurrent log streams
         """
         self.docker_socket = docker_socket or "/var/run/docker.sock"
-        self.client = docker.DockerClient(base_url=f"unix://{self.docker_socket}")
+        self.client = client or docker.DockerClient(base_url=f"unix://{self.docker_socket}")
         self.containers: Dict[str, Container] = {}
         
+        # Latest raw stats sample per container, fed by streaming readers
+        self._latest_stats: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+        # Insertion ordered, so the first entry is the oldest stream; readers
+        # are started from several executor threads at once
+        self._stats_readers: Dict[str, threading.Event] = {}
+        self._stats_readers_lock = threading.Lock()
+        self._max_stats_streams = max_stats_streams
+        
+        # Recent log lines, with timestamps, of containers created here; each
+        # ring is fed by a follower thread holding one log stream open
+        self._log_rings: Dict[str, deque] = {}
+        # Insertion ordered, so the first entry is the oldest follower
+        self._log_followers: Dict[str, threading.Event] = {}
+        # Open log streams, closed on stop to unblock their followers
+        self._log_streams: Dict[str, Any] = {}
+        # Guards the three dicts above, changed by followers and executor threads
+        self._log_lock = threading.Lock()
+        self._max_log_streams = max_log_streams
+        
+        # On-demand samples for containers without a stream, with the time taken
+        self._polled_stats: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._polled_stats_ttl = 2.0
+        
+        # Daemon event stream keeping the caches below in step with changes
+        # made outside this manager
+        self._events = None
+        
+        # Container listings keyed by the `all` flag, with the time fetched
+        self._list_cache: Dict[bool, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._list_cache_ttl = 5.0
+        self._summaries: Dict[str, ContainerSummary] = {}
+        
+        # IDs of running containers, kept current between listings so the
+        # count can be served without a daemon round-trip
+        self._running_ids: Optional[Set[str]] = None
+        
     def create_container(self, config: ContainerConfig) -> str:
         """Create and start a new container.
         
@@ -75,14 +217,20 @@ class ContainerManager:
                 if "cpu_shares" in config.resources:
                     params["cpu_shares"] = config.resources["cpu_shares"]
             
-            # Create container
-            container = self.client.containers.create(**params)
-            
-            # Start container
-            container.start()
+            with self._create_slots:
+                # Create container
+                container = self.client.containers.create(**params)
+                
+                # Start container
+                container.start()
             
             # Store reference
             self.containers[container.id] = container
+            self._start_stats_reader(container)
+            self._start_log_follower(container)
+            self._list_cache.clear()
+            if self._running_ids is not None:
+                self._running_ids.add(container.id)
             
             logger.info(f"Created and started container {config.name} ({container.id})")
             return container.id
@@ -103,7 +251,12 @@ class ContainerManager:
         """
         try:
             container = self._get_container(container_id)
+            self._stop_stats_reader(container_id)
+            self._stop_log_follower(container_id)
             container.stop(timeout=timeout)
+            self._list_cache.clear()
+            if self._running_ids is not None:
+                self._running_ids.discard(container_id)
             logger.info(f"Stopped container {container_id}")
             return True
             
@@ -114,6 +267,64 @@ class ContainerManager:
             logger.error(f"Failed to stop container {container_id}: {e}")
             return False
             
+    def start_container(self, container_id: str) -> bool:
+        """Start a stopped container.
+        
+        Args:
+            container_id: Container ID
+            
+        Returns:
+            True if successful
+        """
+        try:
+            container = self._get_container(container_id)
+            container.start()
+            self._start_stats_reader(container)
+            self._start_log_follower(container)
+            self._list_cache.clear()
+            if self._running_ids is not None:
+                self._running_ids.add(container_id)
+            logger.info(f"Started container {container_id}")
+            return True
+            
+        except NotFound:
+            logger.warning(f"Container {container_id} not found")
+            return False
+        except APIError as e:
+            logger.error(f"Failed to start container {container_id}: {e}")
+            return False
+            
+    def restart_container(self, container_id: str, timeout: int = 10) -> bool:
+        """Restart a container.
+        
+        Args:
+            container_id: Container ID
+            timeout: Timeout in seconds for stopping it
+            
+        Returns:
+            True if successful
+        """
+        try:
+            container = self._get_container(container_id)
+            # Stats and log streams end with the old process
+            self._stop_stats_reader(container_id)
+            self._stop_log_follower(container_id)
+            container.restart(timeout=timeout)
+            self._start_stats_reader(container)
+            self._start_log_follower(container)
+            self._list_cache.clear()
+            if self._running_ids is not None:
+                self._running_ids.add(container_id)
+            logger.info(f"Restarted container {container_id}")
+            return True
+            
+        except NotFound:
+            logger.warning(f"Container {container_id} not found")
+            return False
+        except APIError as e:
+            logger.error(f"Failed to restart container {container_id}: {e}")
+            return False
+            
     def remove_container(self, container_id: str, force: bool = False) -> bool:
         """Remove a container.
         
@@ -126,11 +337,18 @@ class ContainerManager:
         """
         try:
             container = self._get_container(container_id)
+            self._stop_stats_reader(container_id)
+            self._stop_log_follower(container_id)
             container.remove(force=force)
             
             # Remove from internal tracking
             if container_id in self.containers:
                 del self.containers[container_id]
+            self._summaries.pop(container_id, None)
+            self._polled_stats.pop(container_id, None)
+            self._list_cache.clear()
+            if self._running_ids is not None:
+                self._running_ids.discard(container_id)
                 
             logger.info(f"Removed container {container_id}")
             return True
@@ -145,6 +363,9 @@ class ContainerManager:
     def get_container_stats(self, container_id: str) -> Dict[str, Any]:
         """Get container resource usage statistics.
         
+        Containers with a stats stream are served from their latest sample;
+        others are queried on demand, at most once per _polled_stats_ttl.
+        
         Args:
             container_id: Container ID
             
@@ -152,36 +373,179 @@ class ContainerManager:
             Dictionary with container statistics
         """
         try:
-            container = self._get_container(container_id)
-            stats = container.stats(stream=False)
-            
-            # Calculate CPU percentage
-            cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - \
-                       stats["precpu_stats"]["cpu_usage"]["total_usage"]
-            system_delta = stats["cpu_stats"]["system_cpu_usage"] - \
-                          stats["precpu_stats"]["system_cpu_usage"]
-            cpu_percent = 0.0
-            if system_delta > 0.0:
-                cpu_percent = (cpu_delta / system_delta) * 100.0
-            
-            # Calculate memory usage
-            memory_usage = stats["memory_stats"]["usage"]
-            memory_limit = stats["memory_stats"]["limit"]
-            memory_percent = (memory_usage / memory_limit) * 100.0
-            
-            return {
-                "cpu_percent": cpu_percent,
-                "memory_usage": memory_usage,
-                "memory_limit": memory_limit,
-                "memory_percent": memory_percent,
-                "network_rx": stats["networks"]["eth0"]["rx_bytes"],
-                "network_tx": stats["networks"]["eth0"]["tx_bytes"],
-            }
+            with self._stats_lock:
+                stats = self._latest_stats.get(container_id)
+                
+            if stats is None:
+                polled = self._polled_stats.get(container_id)
+                if polled and time.monotonic() - polled[0] < self._polled_stats_ttl:
+                    stats = polled[1]
+                else:
+                    container = self._get_container(container_id)
+                    stats = _project_stats(container.stats(stream=False))
+                    self._polled_stats[container_id] = (time.monotonic(), stats)
+                    
+            return _compute_stats(stats)
             
         except (NotFound, KeyError) as e:
             logger.error(f"Failed to get stats for container {container_id}: {e}")
             return {}
             
+    def _start_stats_reader(self, container: Container) -> None:
+        """Start streaming stats for a container in a background thread.
+        
+        Args:
+            container: Container to watch
+        """
+        with self._stats_readers_lock:
+            if container.id in self._stats_readers or self._max_stats_streams <= 0:
+                return
+                
+            # Make room by retiring the oldest stream
+            evicted = []
+            while len(self._stats_readers) >= self._max_stats_streams:
+                oldest = next(iter(self._stats_readers))
+                evicted.append((oldest, self._stats_readers.pop(oldest)))
+                
+            stop = threading.Event()
+            self._stats_readers[container.id] = stop
+            
+        for container_id, evicted_stop in evicted:
+            self._retire_stats_reader(container_id, evicted_stop)
+            
+        threading.Thread(
+            target=self._read_stats,
+            args=(container, stop),
+            name=f"stats-{container.id[:12]}",
+            daemon=True
+        ).start()
+        
+    def _stop_stats_reader(
+        self,
+        container_id: str,
+        stop: Optional[threading.Event] = None
+    ) -> None:
+        """Stop streaming stats for a container.
+        
+        Args:
+            container_id: Container ID
+            stop: Only stop the reader owning this event, if given
+        """
+        with self._stats_readers_lock:
+            current = self._stats_readers.get(container_id)
+            if stop is not None and current is not stop:
+                return
+            self._stats_readers.pop(container_id, None)
+            
+        self._retire_stats_reader(container_id, current)
+        
+    def _retire_stats_reader(
+        self,
+        container_id: str,
+        stop: Optional[threading.Event]
+    ) -> None:
+        """Signal a reader already dropped from _stats_readers and clear its sample.
+        
+        Args:
+            container_id: Container ID
+            stop: The reader's stop event, if it had one
+        """
+        if stop:
+            stop.set()
+            
+        with self._stats_lock:
+            self._latest_stats.pop(container_id, None)
+            
+    def _read_stats(self, container: Container, stop: threading.Event) -> None:
+        """Keep the latest stats sample of a container until stopped.
+        
+        Args:
+            container: Container to watch
+            stop: Event set when the reader should exit
+        """
+        stream = None
+        try:
+            # Raw frames parsed with orjson; docker-py would decode each
+            # one with the stdlib json module
+            stream = container.stats(stream=True, decode=False)
+            for sample in _iter_stats(stream):
+                # The first sample has no previous CPU reading to diff against
+                if "system_cpu_usage" not in sample.get("precpu_stats", {}):
+                    continue
+                    
+                with self._stats_lock:
+                    if stop.is_set():
+                        break
+                    self._latest_stats[container.id] = sample
+                    
+        except Exception as e:
+            logger.debug(f"Stats stream for container {container.id} ended: {e}")
+        finally:
+            if stream is not None:
+                stream.close()
+                
+            # Free the slot if the stream ended on its own
+            self._stop_stats_reader(container.id, stop)
+                
+    def start_event_watcher(self) -> None:
+        """Follow container events from the daemon in a background thread.
+        
+        Containers created, started, stopped or removed by anyone are then
+        reflected in the listing caches without polling.
+        """
+        if self._events is not None:
+            return
+            
+        self._events = self.client.events(decode=True, filters={"type": "container"})
+        threading.Thread(
+            target=self._watch_events,
+            args=(self._events,),
+            name="docker-events",
+            daemon=True
+        ).start()
+        
+    def _watch_events(self, events: Any) -> None:
+        """Apply container events until the stream is closed.
+        
+        Args:
+            events: Decoded event stream
+        """
+        try:
+            for event in events:
+                container_id = event.get("id") or event.get("Actor", {}).get("ID")
+                if container_id:
+                    self._apply_event(event.get("Action", ""), container_id)
+        except Exception as e:
+            logger.debug(f"Docker event stream ended: {e}")
+            
+    def _apply_event(self, action: str, container_id: str) -> None:
+        """Update cached container state for a daemon event.
+        
+        Args:
+            action: Event action, e.g. "start" or "destroy"
+            container_id: Container ID
+        """
+        if action not in ("create", "start", "die", "destroy"):
+            return
+            
+        self._list_cache.clear()
+        running = self._running_ids
+        
+        if action == "start":
+            if running is not None:
+                running.add(container_id)
+        elif action == "die":
+            if running is not None:
+                running.discard(container_id)
+        elif action == "destroy":
+            if running is not None:
+                running.discard(container_id)
+            self._stop_stats_reader(container_id)
+            self._stop_log_follower(container_id)
+            self.containers.pop(container_id, None)
+            self._summaries.pop(container_id, None)
+            self._polled_stats.pop(container_id, None)
+                
     def list_containers(self, all: bool = False) -> List[Dict[str, Any]]:
         """List containers.
         
@@ -191,18 +555,102 @@ class ContainerManager:
         Returns:
             List of container information
         """
-        containers = self.client.containers.list(all=all)
-        
-        return [
-            {
-                "id": c.id,
-                "name": c.name,
-                "image": c.image.tags[0] if c.image.tags else c.image.id,
-                "status": c.status,
-                "created": c.attrs["Created"],
-            }
-            for c in containers
-        ]
+        cached = self._list_cache.get(all)
+        if cached and time.monotonic() - cached[0] < self._list_cache_ttl:
+            return list(cached[1])
+            
+        # One list call returns every summary; containers.list() would
+        # inspect each container separately
+        summaries = {}
+        image_tags = None
+        for entry in self.client.api.containers(all=all):
+            summary = self._summaries.get(entry["Id"])
+            if summary is None:
+                # Tags of all images in one call, only when a new container shows up
+                if image_tags is None:
+                    image_tags = self._image_tags()
+                summary = ContainerSummary.from_api(entry, image_tags)
+            else:
+                summary.status = entry["State"]
+            summaries[summary.id] = summary
+            
+        # A full listing also drops containers removed behind our back
+        if all:
+            self._summaries = summaries
+        else:
+            self._summaries.update(summaries)
+            
+        # Every fresh listing resyncs the running set
+        self._running_ids = {
+            container_id
+            for container_id, summary in summaries.items()
+            if summary.status == "running"
+        }
+        
+        containers = [summary.to_dict() for summary in summaries.values()]
+        self._list_cache[all] = (time.monotonic(), containers)
+        
+        return list(containers)
+        
+    def _image_tags(self) -> Dict[str, str]:
+        """Get the first tag of every tagged image.
+        
+        Returns:
+            First tag keyed by image ID
+        """
+        image_tags = {}
+        for image in self.client.api.images():
+            # Untagged images are listed with a placeholder tag
+            tags = [tag for tag in image.get("RepoTags") or [] if tag != "<none>:<none>"]
+            if tags:
+                image_tags[image["Id"]] = tags[0]
+        return image_tags
+        
+    def count_running(self) -> int:
+        """Count running containers.
+        
+        The count is tracked across create, stop and remove, and resynced
+        whenever the containers are listed; only the first call lists them.
+        
+        Returns:
+            Number of running containers
+        """
+        if self._running_ids is None:
+            self.list_containers()
+            
+        return len(self._running_ids)
+        
+    def inspect_many(
+        self,
+        container_ids: List[str],
+        max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """Inspect several containers concurrently.
+        
+        Args:
+            container_ids: Container IDs
+            max_workers: Maximum concurrent inspect requests
+            
+        Returns:
+            Inspect data keyed by container ID, without missing containers
+        """
+        if not container_ids:
+            return {}
+            
+        def inspect(container_id: str) -> Optional[Dict[str, Any]]:
+            try:
+                return self.client.api.inspect_container(container_id)
+            except NotFound:
+                return None
+                
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(container_ids))) as pool:
+            results = pool.map(inspect, container_ids)
+            
+        return {
+            container_id: data
+            for container_id, data in zip(container_ids, results)
+            if data is not None
+        }
         
     def get_container_logs(
         self, 
@@ -220,6 +668,14 @@ class ContainerManager:
         Returns:
             Container logs as string
         """
+        ring = self._log_rings.get(container_id)
+        if ring is not None and 0 < tail <= LOG_RING_LINES:
+            lines = list(ring)[-tail:]
+            if not timestamps:
+                # Followed lines always carry their RFC 3339 timestamp
+                lines = [line.partition(" ")[2] for line in lines]
+            return "".join(f"{line}\n" for line in lines)
+            
         try:
             container = self._get_container(container_id)
             logs = container.logs(
@@ -233,6 +689,121 @@ class ContainerManager:
             logger.error(f"Container {container_id} not found")
             return ""
             
+    def _start_log_follower(self, container: Container) -> None:
+        """Follow the log of a container in a background thread.
+        
+        Args:
+            container: Container to follow
+        """
+        with self._log_lock:
+            if container.id in self._log_followers or self._max_log_streams <= 0:
+                return
+                
+            # Make room by retiring the oldest follower
+            evicted = []
+            while len(self._log_followers) >= self._max_log_streams:
+                evicted.append(self._pop_log_follower(next(iter(self._log_followers))))
+                
+            stop = threading.Event()
+            self._log_followers[container.id] = stop
+            
+        for evicted_stop, stream in evicted:
+            _release_log_follower(evicted_stop, stream)
+            
+        threading.Thread(
+            target=self._follow_logs,
+            args=(container, stop),
+            name=f"logs-{container.id[:12]}",
+            daemon=True
+        ).start()
+        
+    def _stop_log_follower(
+        self,
+        container_id: str,
+        stop: Optional[threading.Event] = None
+    ) -> None:
+        """Stop following the log of a container and drop its lines.
+        
+        Args:
+            container_id: Container ID
+            stop: Only stop the follower owning this event, if given
+        """
+        with self._log_lock:
+            if stop is not None and self._log_followers.get(container_id) is not stop:
+                return
+            current, stream = self._pop_log_follower(container_id)
+            
+        _release_log_follower(current, stream)
+        
+    def _pop_log_follower(self, container_id: str) -> Tuple[Optional[threading.Event], Any]:
+        """Drop a follower's bookkeeping; the caller holds _log_lock.
+        
+        Args:
+            container_id: Container ID
+            
+        Returns:
+            The follower's stop event and open stream, if any
+        """
+        self._log_rings.pop(container_id, None)
+        return (
+            self._log_followers.pop(container_id, None),
+            self._log_streams.pop(container_id, None)
+        )
+        
+    def _follow_logs(self, container: Container, stop: threading.Event) -> None:
+        """Keep the latest log lines of a container until stopped.
+        
+        Args:
+            container: Container to follow
+            stop: Event set when the follower should exit
+        """
+        ring: deque = deque(maxlen=LOG_RING_LINES)
+        published = False
+        partial = b""
+        stream = None
+        try:
+            stream = container.logs(
+                stream=True,
+                follow=True,
+                tail=LOG_RING_LINES,
+                timestamps=True
+            )
+            
+            # A follower stopped meanwhile has nobody to close its stream
+            with self._log_lock:
+                if self._log_followers.get(container.id) is not stop:
+                    return
+                self._log_streams[container.id] = stream
+                
+            for chunk in stream:
+                if stop.is_set():
+                    break
+                    
+                # Chunks are frames, not lines; hold back an unfinished line
+                *lines, partial = (partial + chunk).split(b"\n")
+                ring.extend(
+                    line.rstrip(b"\r").decode("utf-8", errors="replace") for line in lines
+                )
+                
+                # Served only once it holds the start of the backlog
+                if not published:
+                    with self._log_lock:
+                        if self._log_followers.get(container.id) is stop:
+                            self._log_rings[container.id] = ring
+                    published = True
+                    
+        except Exception as e:
+            logger.debug(f"Log stream for container {container.id} ended: {e}")
+        finally:
+            if stream is not None:
+                with self._log_lock:
+                    if self._log_streams.get(container.id) is stream:
+                        del self._log_streams[container.id]
+                stream.close()
+                
+            # A stream that ended by itself no longer tracks the log
+            self._stop_log_follower(container.id, stop)
+            
     def _get_container(self, container_id: str) -> Container:
         """Get container object by ID.
         
@@ -256,7 +827,117 @@ class ContainerManager:
         
     def cleanup(self) -> None:
         """Cleanup resources and close connections."""
+        for container_id in list(self._stats_readers):
+            self._stop_stats_reader(container_id)
+            
+        for container_id in list(self._log_followers):
+            self._stop_log_follower(container_id)
+            
+        if self._events is not None:
+            self._events.close()
+            self._events = None
+            
         try:
             self.client.close()
         except Exception as e:
-            logger.error(f"Error closing Docker client: {e}")
\ No newline at end of file
+            logger.error(f"Error closing Docker client: {e}")
+
+
+def _release_log_follower(stop: Optional[threading.Event], stream: Any) -> None:
+    """Signal a follower dropped from the bookkeeping and close its stream.
+    
+    Args:
+        stop: The follower's stop event, if it had one
+        stream: Its open log stream, if any
+    """
+    if stop:
+        stop.set()
+        
+    # The follower may be blocked waiting for output; closing the stream
+    # wakes it up
+    if stream is not None:
+        stream.close()
+def _iter_stats(stream: Iterable[Union[bytes, str]]) -> Iterator[Dict[str, Any]]:
+    """Parse a raw stats stream into trimmed samples.
+    
+    dockerd writes one JSON document per line, but the HTTP chunks read
+    from the stream need not line up with them.
+    
+    Args:
+        stream: Raw chunks from a stats stream
+        
+    Yields:
+        Stats samples restricted to _STATS_FIELDS
+    """
+    buffer = b""
+    for chunk in stream:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        buffer += chunk
+        if b"\n" not in chunk:
+            continue
+            
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield _project_stats(orjson.loads(line))
+                
+    if buffer.strip():
+        yield _project_stats(orjson.loads(buffer))
+
+
+def _project_stats(sample: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the stats fields that are used downstream.
+    
+    Args:
+        sample: Raw stats sample
+        
+    Returns:
+        Sample restricted to _STATS_FIELDS
+    """
+    return {key: sample[key] for key in _STATS_FIELDS if key in sample}
+
+
+def _compute_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Derive usage figures from a raw Docker stats sample.
+    
+    Args:
+        stats: Raw stats sample
+        
+    Returns:
+        Dictionary with container statistics
+        
+    Raises:
+        KeyError: If the sample lacks a required field
+    """
+    cpu_stats = stats["cpu_stats"]
+    precpu_stats = stats["precpu_stats"]
+    
+    # Calculate CPU percentage
+    cpu_delta = cpu_stats["cpu_usage"]["total_usage"] - \
+               precpu_stats["cpu_usage"]["total_usage"]
+    system_delta = cpu_stats["system_cpu_usage"] - precpu_stats["system_cpu_usage"]
+    cpu_percent = 0.0
+    if system_delta > 0.0:
+        cpu_percent = (cpu_delta / system_delta) * 100.0
+        
+    # Calculate memory usage
+    memory_usage, memory_limit = _get_memory(stats["memory_stats"])
+    memory_percent = (memory_usage / memory_limit) * 100.0
+    
+    # Total traffic over every interface rather than just eth0
+    networks = stats.get("networks") or {}
+    network_rx = 0
+    network_tx = 0
+    for rx_bytes, tx_bytes in map(_get_traffic, networks.values()):
+        network_rx += rx_bytes
+        network_tx += tx_bytes
+        
+    return {
+        "cpu_percent": cpu_percent,
+        "memory_usage": memory_usage,
+        "memory_limit": memory_limit,
+        "memory_percent": memory_percent,
+        "network_rx": network_rx,
+        "network_tx": network_tx,
+    }
\ No newline at end of file
@@ -1,17 +1,23 @@
 """Main orchestration engine."""
 
 import asyncio
+import functools
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import docker
 
 from orchestrator.core.config_loader import ConfigLoader, OrchestratorConfig
-from orchestrator.core.container_manager import ContainerManager
+from orchestrator.core.container_manager import ContainerManager, MAX_CONCURRENT_CREATES
 from orchestrator.core.session_manager import SessionManager
 from orchestrator.utils.monitoring import ResourceMonitor
 
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class Orchestrator:
     """Main orchestration engine coordinating all components."""
@@ -25,16 +31,38 @@ class Orchestrator:
         self.config_loader = ConfigLoader(config_dir)
         self.config = self.config_loader.load_orchestrator_config()
         
-        self.container_manager = ContainerManager(self.config.docker_socket)
+        # One client, and so one connection pool, shared by every component.
+        # Its pool is sized for the API threadpool plus the stats streams.
+        self.docker_client = docker.DockerClient(
+            base_url=f"unix://{self.config.docker_socket}",
+            max_pool_size=self.config.docker_pool_size
+        )
+        
+        # Blocking docker-py calls run here, off the event loop and apart
+        # from the generic API threadpool
+        self._docker_pool = ThreadPoolExecutor(
+            max_workers=self.config.docker_workers,
+            thread_name_prefix="docker"
+        )
+        
+        self.container_manager = ContainerManager(
+            self.config.docker_socket,
+            client=self.docker_client
+        )
         self.session_manager = SessionManager(
             max_sessions=self.config.max_sessions,
-            timeout_seconds=self.config.session_timeout
+            timeout_seconds=self.config.session_timeout,
+            docker_client=self.docker_client,
+            docker_executor=self._docker_pool
         )
         self.resource_monitor = ResourceMonitor()
         
         self._running = False
         self._tasks: list[asyncio.Task] = []
         
+        # Queue container creation here rather than in worker threads
+        self._create_sem = asyncio.Semaphore(MAX_CONCURRENT_CREATES)
+        
     async def start(self) -> None:
         """Start the orchestrator."""
         logger.info("Starting Container Terminal Orchestrator")
@@ -44,6 +72,18 @@ class Orchestrator:
         # Load container configurations
         self.config_loader.load_container_configs()
         
+        # Keep container caches current with changes made outside the API
+        try:
+            await self.run_docker(self.container_manager.start_event_watcher)
+        except Exception as e:
+            logger.warning(f"Could not subscribe to Docker events: {e}")
+        
+        # Prime the running count so /health never lists containers on the loop
+        try:
+            await self.run_docker(self.container_manager.list_containers)
+        except Exception as e:
+            logger.warning(f"Could not list containers: {e}")
+        
         # Start background tasks
         self._tasks.append(
             asyncio.create_task(self.session_manager.start_cleanup_task())
@@ -60,24 +100,41 @@ class Orchestrator:
         
         self._running = False
         
-        # Stop background tasks
-        await self.session_manager.stop_cleanup_task()
-        await self.resource_monitor.stop_monitoring()
-        
-        # Cancel all tasks
+        # Cancel all tasks, then let them finish together
         for task in self._tasks:
             task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-                
+            
+        await asyncio.gather(
+            self.session_manager.stop_cleanup_task(),
+            self.resource_monitor.stop_monitoring(),
+            *self._tasks,
+            return_exceptions=True
+        )
+        self._tasks.clear()
+        
         # Cleanup resources
         self.session_manager.cleanup()
         self.container_manager.cleanup()
+        self._docker_pool.shutdown(wait=False)
         
         logger.info("Orchestrator stopped")
         
+    async def run_docker(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking docker-py call on the Docker thread pool.
+        
+        Args:
+            func: Blocking callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            Result of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._docker_pool, functools.partial(func, *args, **kwargs)
+        )
+        
     async def create_container(self, container_name: str) -> Dict[str, Any]:
         """Create a container from configuration.
         
@@ -91,7 +148,10 @@ class Orchestrator:
         if not config:
             raise ValueError(f"Container configuration '{container_name}' not found")
             
-        container_id = self.container_manager.create_container(config)
+        async with self._create_sem:
+            container_id = await self.run_docker(
+                self.container_manager.create_container, config
+            )
         
         return {
             "container_id": container_id,
@@ -141,7 +201,7 @@ class Orchestrator:
                 "max_sessions": self.config.max_sessions,
             },
             "system": self.resource_monitor.get_current_stats(),
-            "containers": len(self.container_manager.list_containers())
+            "containers": self.container_manager.count_running()
         }
         
     def reload_configurations(self) -> None:
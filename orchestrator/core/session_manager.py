@@ -1,10 +1,16 @@
 """Terminal session management."""
 
 import asyncio
+import functools
+import heapq
 import logging
+import time
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, Callable
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union
+
+import docker
 
 from orchestrator.terminal.pty_handler import PTYHandler
 from orchestrator.terminal.pexpect_handler import PexpectHandler
@@ -12,6 +18,28 @@ from orchestrator.terminal.pexpect_handler import PexpectHandler
 
 logger = logging.getLogger(__name__)
 
+# Resize requests within this many seconds are applied once, with the
+# latest size; dragging a window sends dozens of them
+RESIZE_DEBOUNCE = 0.05
+
+# Wall-clock time at a known monotonic instant, for reporting monotonic
+# timestamps as dates
+_WALL_BASE = time.time()
+_MONOTONIC_BASE = time.monotonic()
+
+
+def _to_datetime(timestamp: float) -> datetime:
+    """Convert a time.monotonic() timestamp to a naive UTC datetime.
+    
+    Args:
+        timestamp: Monotonic timestamp
+        
+    Returns:
+        Corresponding wall-clock time
+    """
+    wall = _WALL_BASE + (timestamp - _MONOTONIC_BASE)
+    return datetime.fromtimestamp(wall, timezone.utc).replace(tzinfo=None)
+
 
 class Session:
     """Represents a terminal session."""
@@ -21,7 +49,9 @@ class Session:
         session_id: str,
         container_id: str,
         pty_handler: PTYHandler,
-        pexpect_handler: Optional[PexpectHandler] = None
+        pexpect_handler: Optional[PexpectHandler] = None,
+        clock: Callable[[], float] = time.monotonic,
+        executor: Optional[Executor] = None
     ):
         """Initialize session.
         
@@ -30,44 +60,74 @@ class Session:
             container_id: Associated container ID
             pty_handler: PTY handler instance
             pexpect_handler: Optional pexpect handler
+            clock: Clock for activity timestamps
+            executor: Optional executor for blocking Docker calls
         """
         self.session_id = session_id
         self.container_id = container_id
         self.pty_handler = pty_handler
         self.pexpect_handler = pexpect_handler
-        self.created_at = datetime.utcnow()
-        self.last_activity = datetime.utcnow()
+        # time.monotonic() timestamps; see _to_datetime for display
+        self._clock = clock
+        self._executor = executor
+        self.created_at = clock()
+        self.last_activity = self.created_at
         self.active = True
-        self._output_callbacks: list[Callable[[str], None]] = []
+        # Rebuilt on the rare add/remove so dispatch iterates a fixed tuple
+        self._output_callbacks: Tuple[Callable[[bytes], None], ...] = ()
+        
+        # Output read but not yet dispatched, see SessionManager.coalesce_delay.
+        # The PTY is read straight into this buffer, allocated by the manager.
+        self._pending = bytearray()
+        self._pending_size = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Only used for PTYs that cannot be watched with add_reader
+        self._reader_task: Optional[asyncio.Task] = None
+        
+        # Latest requested size, applied once the debounce window ends
+        self._resize_to: Optional[Tuple[int, int]] = None
+        self._resize_handle: Optional[asyncio.TimerHandle] = None
+        # Size the PTY was last resized to, and the resize in flight; only
+        # touched on the loop, and at most one resize runs at a time so an
+        # older size can never land after a newer one
+        self._size: Optional[Tuple[int, int]] = None
+        self._resizing: Optional[asyncio.Future] = None
         
-    def add_output_callback(self, callback: Callable[[str], None]) -> None:
+    def add_output_callback(self, callback: Callable[[bytes], None]) -> None:
         """Add callback for output data.
         
         Args:
-            callback: Function to call with output data
+            callback: Function to call with raw output bytes
         """
-        self._output_callbacks.append(callback)
+        self._output_callbacks += (callback,)
         
-    def remove_output_callback(self, callback: Callable[[str], None]) -> None:
+    def remove_output_callback(self, callback: Callable[[bytes], None]) -> None:
         """Remove output callback.
         
         Args:
             callback: Callback to remove
         """
-        if callback in self._output_callbacks:
-            self._output_callbacks.remove(callback)
+        self._output_callbacks = tuple(
+            cb for cb in self._output_callbacks if cb != callback
+        )
             
-    def send_input(self, data: str) -> None:
+    def send_input(self, data: Union[bytes, str, List[Union[bytes, str]]]) -> None:
         """Send input to terminal.
         
         Args:
-            data: Input data to send
+            data: Input data to send, or several queued chunks to send at once
         """
-        self.last_activity = datetime.utcnow()
-        if self.pexpect_handler:
+        self.last_activity = self._clock()
+        if isinstance(data, list):
+            chunks = [c.encode() if isinstance(c, str) else c for c in data]
+            if self.pexpect_handler:
+                self.pexpect_handler.send(b"".join(chunks))
+            else:
+                self.pty_handler.write(chunks)
+        elif self.pexpect_handler:
             self.pexpect_handler.send(data)
         else:
-            self.pty_handler.write(data.encode())
+            self.pty_handler.write(data.encode() if isinstance(data, str) else data)
             
     def resize(self, rows: int, cols: int) -> None:
         """Resize terminal.
@@ -76,10 +136,65 @@ class Session:
             rows: Number of rows
             cols: Number of columns
         """
-        self.pty_handler.resize(rows, cols)
+        self._resize_to = (rows, cols)
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._apply_resize()
+            return
+            
+        if not self._resize_handle:
+            self._resize_handle = loop.call_later(RESIZE_DEBOUNCE, self._apply_resize)
+            
+    def _apply_resize(self) -> None:
+        """Resize the PTY to the latest requested size."""
+        self._resize_handle = None
+        
+        # The running resize picks up the latest size when it finishes
+        if self._resizing:
+            return
+            
+        # Nothing to do for a repeat of the current size
+        size = self._resize_to
+        if size == self._size:
+            return
+            
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if self.pty_handler.resize(*size):
+                self._size = size
+            return
+            
+        # The resize is a daemon round-trip, so keep it off the loop
+        self._resizing = loop.run_in_executor(self._executor, self.pty_handler.resize, *size)
+        self._resizing.add_done_callback(functools.partial(self._on_resized, size))
+        
+    def _on_resized(self, size: Tuple[int, int], future: asyncio.Future) -> None:
+        """Record a finished resize and send any size requested meanwhile.
+        
+        Args:
+            size: Size that was sent
+            future: Completed resize; nobody else awaits it
+        """
+        self._resizing = None
+        if future.cancelled():
+            return
+        if future.exception():
+            logger.error(f"Error resizing session {self.session_id}: {future.exception()}")
+        elif future.result():
+            self._size = size
+            
+        # Only a newer request is sent; a failed size is not retried
+        if self.active and self._resize_to != size and not self._resize_handle:
+            self._apply_resize()
         
     def close(self) -> None:
         """Close the session."""
+        if self._resize_handle:
+            self._resize_handle.cancel()
+            self._resize_handle = None
         self.active = False
         if self.pexpect_handler:
             self.pexpect_handler.close()
@@ -89,18 +204,41 @@ class Session:
 class SessionManager:
     """Manages terminal sessions."""
     
-    def __init__(self, max_sessions: int = 50, timeout_seconds: int = 3600):
+    def __init__(
+        self,
+        max_sessions: int = 50,
+        timeout_seconds: int = 3600,
+        docker_client: Optional[docker.DockerClient] = None,
+        docker_executor: Optional[Executor] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
         """Initialize session manager.
         
         Args:
             max_sessions: Maximum concurrent sessions
             timeout_seconds: Session timeout in seconds
+            docker_client: Optional shared Docker client for PTY handlers
+            docker_executor: Optional executor for blocking Docker calls
+            clock: Monotonic clock for session activity, replaceable in tests
         """
         self.max_sessions = max_sessions
         self.timeout_seconds = timeout_seconds
+        self.docker_client = docker_client
+        self.docker_executor = docker_executor
+        self.clock = clock
         self.sessions: Dict[str, Session] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
         
+        # (last_activity, session_id) min-heap; entries may be stale and are
+        # re-checked against the session when they reach the top
+        self._activity_heap: list[Tuple[float, str]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Output arriving within coalesce_delay seconds is dispatched as one
+        # chunk, or sooner once coalesce_bytes are pending
+        self.coalesce_delay = 0.002
+        self.coalesce_bytes = 65536
+        
     async def create_session(
         self,
         container_id: str,
@@ -123,10 +261,13 @@ class SessionManager:
         if len(self.sessions) >= self.max_sessions:
             raise RuntimeError(f"Maximum sessions ({self.max_sessions}) reached")
             
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         
-        # Create PTY handler
-        pty_handler = PTYHandler(container_id)
+        # Create PTY handler; it looks the container up, so keep it off the loop
+        pty_handler = await asyncio.get_running_loop().run_in_executor(
+            self.docker_executor,
+            functools.partial(PTYHandler, container_id, client=self.docker_client)
+        )
         await pty_handler.connect(command)
         
         # Optionally create pexpect handler
@@ -139,13 +280,25 @@ class SessionManager:
             session_id=session_id,
             container_id=container_id,
             pty_handler=pty_handler,
-            pexpect_handler=pexpect_handler
+            pexpect_handler=pexpect_handler,
+            clock=self.clock,
+            executor=self.docker_executor
         )
         
+        session._pending = bytearray(self.coalesce_bytes)
+        
+        if pexpect_handler:
+            session.add_output_callback(pexpect_handler.feed)
+            
         self.sessions[session_id] = session
+        heapq.heappush(self._activity_heap, (session.last_activity, session_id))
         
-        # Start output reader
-        asyncio.create_task(self._read_output(session))
+        # Dispatch output whenever the PTY becomes readable
+        self._loop = asyncio.get_running_loop()
+        if pty_handler.selectable:
+            self._loop.add_reader(pty_handler.fileno(), self._on_readable, session)
+        else:
+            session._reader_task = asyncio.create_task(self._read_loop(session))
         
         logger.info(f"Created session {session_id} for container {container_id}")
         return session_id
@@ -174,12 +327,34 @@ class SessionManager:
         if not session:
             return False
             
+        self._stop_reading(session)
         session.close()
         del self.sessions[session_id]
         
         logger.info(f"Closed session {session_id}")
         return True
         
+    def describe_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Describe a session.
+        
+        Args:
+            session_id: Session ID
+            
+        Returns:
+            Session information or None
+        """
+        session = self.sessions.get(session_id)
+        if not session:
+            return None
+            
+        return {
+            "session_id": session.session_id,
+            "container_id": session.container_id,
+            "created_at": _to_datetime(session.created_at).isoformat(),
+            "last_activity": _to_datetime(session.last_activity).isoformat(),
+            "active": session.active,
+        }
+        
     def list_sessions(self) -> list[Dict[str, Any]]:
         """List all active sessions.
         
@@ -190,36 +365,125 @@ class SessionManager:
             {
                 "session_id": s.session_id,
                 "container_id": s.container_id,
-                "created_at": s.created_at.isoformat(),
-                "last_activity": s.last_activity.isoformat(),
+                "created_at": _to_datetime(s.created_at).isoformat(),
+                "last_activity": _to_datetime(s.last_activity).isoformat(),
                 "active": s.active,
             }
             for s in self.sessions.values()
         ]
         
-    async def _read_output(self, session: Session) -> None:
-        """Read output from session PTY.
+    def _on_readable(self, session: Session) -> None:
+        """Collect output once the session PTY is readable.
         
         Args:
             session: Session to read from
         """
+        # Read into the free tail of the pending buffer, no per-read bytes
         try:
-            while session.active:
-                data = await session.pty_handler.read()
-                if data:
-                    # Notify callbacks
-                    for callback in session._output_callbacks:
-                        try:
-                            callback(data)
-                        except Exception as e:
-                            logger.error(f"Error in output callback: {e}")
-                else:
-                    # No data, sleep briefly
-                    await asyncio.sleep(0.01)
-                    
+            with memoryview(session._pending) as view:
+                size = session.pty_handler.read_into(view[session._pending_size:])
+        except BlockingIOError:
+            # Spurious wakeup, wait for the next one
+            return
+            
+        if not size:
+            # Readable but empty means the PTY was closed
+            self._on_closed(session)
+            return
+            
+        self._on_output(session, size)
+        
+    async def _read_loop(self, session: Session) -> None:
+        """Collect output from a PTY that cannot be watched with add_reader.
+        
+        Args:
+            session: Session to read from
+        """
+        while session.active:
+            data = await session.pty_handler.read(
+                len(session._pending) - session._pending_size
+            )
+            if not data:
+                self._on_closed(session)
+                return
+                
+            # A flush may have run meanwhile, which only frees more space
+            start = session._pending_size
+            session._pending[start:start + len(data)] = data
+            self._on_output(session, len(data))
+            
+    def _on_closed(self, session: Session) -> None:
+        """Flush what is left once the session PTY was closed.
+        
+        Args:
+            session: Session whose PTY was closed
+        """
+        self._flush_output(session)
+        self._stop_reading(session)
+        session.active = False
+        
+    def _on_output(self, session: Session, size: int) -> None:
+        """Account for output read into the pending buffer.
+        
+        Args:
+            session: Session that produced output
+            size: Number of bytes added to the pending buffer
+        """
+        session._pending_size += size
+        
+        if session._pending_size >= len(session._pending):
+            self._flush_output(session)
+        elif not session._flush_handle:
+            session._flush_handle = self._loop.call_later(
+                self.coalesce_delay, self._flush_output, session
+            )
+            
+    def _flush_output(self, session: Session) -> None:
+        """Dispatch pending output to the session callbacks.
+        
+        Args:
+            session: Session to flush
+        """
+        if session._flush_handle:
+            session._flush_handle.cancel()
+            session._flush_handle = None
+            
+        if not session._pending_size:
+            return
+            
+        with memoryview(session._pending) as view:
+            data = bytes(view[:session._pending_size])
+        session._pending_size = 0
+        
+        # Notify callbacks
+        for callback in session._output_callbacks:
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error("Error in output callback: %s", e)
+                
+    def _stop_reading(self, session: Session) -> None:
+        """Stop watching a session PTY for output.
+        
+        Args:
+            session: Session to stop reading from
+        """
+        if not self._loop or not session.active:
+            return
+            
+        if session._flush_handle:
+            session._flush_handle.cancel()
+            session._flush_handle = None
+            
+        if session._reader_task:
+            session._reader_task.cancel()
+            session._reader_task = None
+            return
+            
+        try:
+            self._loop.remove_reader(session.pty_handler.fileno())
         except Exception as e:
-            logger.error(f"Error reading session output: {e}")
-            session.active = False
+            logger.error(f"Error removing PTY reader: {e}")
             
     async def start_cleanup_task(self) -> None:
         """Start background cleanup task."""
@@ -242,25 +506,33 @@ class SessionManager:
             try:
                 await asyncio.sleep(60)  # Check every minute
                 
-                now = datetime.utcnow()
-                timeout_delta = timedelta(seconds=self.timeout_seconds)
+                self._expire_sessions()
                 
-                # Find timed out sessions
-                timed_out = [
-                    sid for sid, session in self.sessions.items()
-                    if now - session.last_activity > timeout_delta
-                ]
-                
-                # Close timed out sessions
-                for session_id in timed_out:
-                    logger.info(f"Closing timed out session {session_id}")
-                    self.close_session(session_id)
-                    
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in cleanup loop: {e}")
                 
+    def _expire_sessions(self) -> None:
+        """Close sessions that have been idle longer than the timeout."""
+        # Anything last active before this is stale
+        cutoff = self.clock() - self.timeout_seconds
+        heap = self._activity_heap
+        
+        while heap and heap[0][0] < cutoff:
+            _, session_id = heapq.heappop(heap)
+            
+            session = self.sessions.get(session_id)
+            if not session:
+                continue
+                
+            if session.last_activity < cutoff:
+                logger.info(f"Closing timed out session {session_id}")
+                self.close_session(session_id)
+            else:
+                # Active since it was queued, so requeue at its latest activity
+                heapq.heappush(heap, (session.last_activity, session_id))
+                
     def cleanup(self) -> None:
         """Cleanup all sessions."""
         for session_id in list(self.sessions.keys()):
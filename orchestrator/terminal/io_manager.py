@@ -2,7 +2,7 @@
 
 import asyncio
 import logging
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, List, Tuple, Union
 from collections import deque
 
 
@@ -12,36 +12,45 @@ logger = logging.getLogger(__name__)
 class IOManager:
     """Manages input/output streams for terminal sessions."""
     
-    def __init__(self, buffer_size: int = 10000):
+    def __init__(self, buffer_size: int = 1024 * 1024):
         """Initialize I/O manager.
         
         Args:
-            buffer_size: Maximum buffer size for output
+            buffer_size: Capacity of the output ring buffer in bytes
         """
         self.buffer_size = buffer_size
-        self._output_buffer = deque(maxlen=buffer_size)
-        self._input_queue: asyncio.Queue = asyncio.Queue()
-        self._output_callbacks: list[Callable[[str], Any]] = []
+        # Output is kept as raw bytes in a fixed ring; _head is the next
+        # write position and _size the number of valid bytes behind it
+        self._ring = bytearray(buffer_size)
+        self._head = 0
+        self._size = 0
+        # Input is consumed by a single writer, so a deque plus a wakeup
+        # event is enough and avoids a future per queued item
+        self._input: deque[Union[bytes, str]] = deque()
+        self._input_ready = asyncio.Event()
+        # (is_coroutine, callback) pairs, checked once at registration
+        self._output_callbacks: Tuple[Tuple[bool, Callable[[bytes], Any]], ...] = ()
         self._closed = False
         
-    def add_output_callback(self, callback: Callable[[str], Any]) -> None:
+    def add_output_callback(self, callback: Callable[[bytes], Any]) -> None:
         """Add callback for output data.
         
         Args:
-            callback: Function to call with output data
+            callback: Function to call with raw output bytes
         """
-        self._output_callbacks.append(callback)
+        self._output_callbacks += ((asyncio.iscoroutinefunction(callback), callback),)
         
-    def remove_output_callback(self, callback: Callable[[str], Any]) -> None:
+    def remove_output_callback(self, callback: Callable[[bytes], Any]) -> None:
         """Remove output callback.
         
         Args:
             callback: Callback to remove
         """
-        if callback in self._output_callbacks:
-            self._output_callbacks.remove(callback)
+        self._output_callbacks = tuple(
+            entry for entry in self._output_callbacks if entry[1] != callback
+        )
             
-    async def write_output(self, data: str) -> None:
+    async def write_output(self, data: bytes) -> None:
         """Write data to output buffer and notify callbacks.
         
         Args:
@@ -51,76 +60,143 @@ class IOManager:
             return
             
         # Add to buffer
-        self._output_buffer.append(data)
+        self._append_output(data)
         
+        # Nothing attached is the common case between WebSocket clients
+        callbacks = self._output_callbacks
+        if not callbacks:
+            return
+            
         # Notify callbacks
-        for callback in self._output_callbacks:
+        for is_coroutine, callback in callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
+                if is_coroutine:
                     await callback(data)
                 else:
                     callback(data)
             except Exception as e:
-                logger.error(f"Error in output callback: {e}")
+                logger.error("Error in output callback: %s", e)
                 
-    async def queue_input(self, data: str) -> None:
+    def _append_output(self, data: bytes) -> None:
+        """Copy data into the output ring, overwriting the oldest bytes.
+        
+        Args:
+            data: Output data
+        """
+        ring = self._ring
+        capacity = len(ring)
+        size = len(data)
+        if not capacity or not size:
+            return
+            
+        view = memoryview(data)
+        if size >= capacity:
+            ring[:] = view[size - capacity:]
+            self._head = 0
+            self._size = capacity
+            return
+            
+        head = self._head
+        end = head + size
+        if end <= capacity:
+            ring[head:end] = view
+        else:
+            split = capacity - head
+            ring[head:] = view[:split]
+            ring[:end - capacity] = view[split:]
+            
+        self._head = end % capacity
+        self._size = min(self._size + size, capacity)
+        
+    async def queue_input(self, data: Union[bytes, str]) -> None:
         """Queue input data.
         
         Args:
             data: Input data
         """
         if not self._closed:
-            await self._input_queue.put(data)
+            self._input.append(data)
+            self._input_ready.set()
             
-    async def get_input(self) -> Optional[str]:
+    async def get_input(self) -> Optional[Union[bytes, str]]:
         """Get queued input data.
         
         Returns:
             Input data or None if closed
         """
-        if self._closed:
-            return None
-            
-        try:
-            return await self._input_queue.get()
-        except asyncio.CancelledError:
-            return None
+        while not self._closed:
+            if self._input:
+                data = self._input.popleft()
+                if not self._input:
+                    self._input_ready.clear()
+                return data
+                
+            try:
+                await self._input_ready.wait()
+            except asyncio.CancelledError:
+                return None
+                
+        return None
             
-    def get_output_buffer(self, lines: Optional[int] = None) -> list[str]:
+    def get_output_buffer(
+        self,
+        lines: Optional[int] = None,
+        as_str: bool = False
+    ) -> Union[bytes, str]:
         """Get output buffer contents.
         
         Args:
-            lines: Number of lines to retrieve (None for all)
+            lines: Number of trailing lines to retrieve (None for all)
+            as_str: Decode the output into a string
             
         Returns:
-            List of output lines
+            Raw output bytes, or the decoded text
         """
-        if lines is None:
-            return list(self._output_buffer)
+        ring = self._ring
+        start = (self._head - self._size) % len(ring) if ring else 0
+        end = start + self._size
+        if end <= len(ring):
+            data = bytes(ring[start:end])
         else:
-            return list(self._output_buffer)[-lines:]
+            data = bytes(ring[start:]) + bytes(ring[:self._head])
+            
+        if lines is not None:
+            # Walk back from the end instead of splitting the whole buffer
+            pos = len(data) - 1 if data.endswith(b"\n") else len(data)
+            for _ in range(lines):
+                pos = data.rfind(b"\n", 0, pos)
+                if pos < 0:
+                    break
+            data = data[pos + 1:]
+            
+        if as_str:
+            return data.decode("utf-8", errors="replace")
+        return data
             
     def clear_output_buffer(self) -> None:
         """Clear output buffer."""
-        self._output_buffer.clear()
+        self._head = 0
+        self._size = 0
         
     async def pipe_streams(
         self,
-        read_func: Callable[[], str],
-        write_func: Callable[[bytes], None]
+        fd: int,
+        read_func: Callable[[], bytes],
+        write_func: Callable[[List[bytes]], None]
     ) -> None:
         """Pipe data between read and write functions.
         
         Args:
-            read_func: Function to read data
-            write_func: Function to write data
+            fd: File descriptor that becomes readable when output arrives
+            read_func: Function to read available data
+            write_func: Function to write a batch of input chunks at once
         """
         # Create tasks for input and output
         input_task = asyncio.create_task(
             self._handle_input(write_func)
         )
         output_task = asyncio.create_task(
-            self._handle_output(read_func)
+            self._handle_output(fd, read_func)
         )
         
         try:
@@ -131,37 +207,70 @@ class IOManager:
             input_task.cancel()
             output_task.cancel()
             
-    async def _handle_input(self, write_func: Callable[[bytes], None]) -> None:
+    async def _handle_input(self, write_func: Callable[[List[bytes]], None]) -> None:
         """Handle input stream.
         
         Args:
-            write_func: Function to write data
+            write_func: Function to write a batch of input chunks at once
         """
         while not self._closed:
             try:
                 data = await self.get_input()
-                if data:
-                    write_func(data.encode())
+                if not data:
+                    continue
+                    
+                # Hand everything queued meanwhile over in one write
+                batch = [data]
+                while self._input:
+                    batch.append(self._input.popleft())
+                self._input_ready.clear()
+                
+                write_func([
+                    chunk.encode() if isinstance(chunk, str) else chunk
+                    for chunk in batch
+                    if chunk
+                ])
             except Exception as e:
-                logger.error(f"Error handling input: {e}")
+                logger.error("Error handling input: %s", e)
                 
-    async def _handle_output(self, read_func: Callable[[], str]) -> None:
+    async def _handle_output(self, fd: int, read_func: Callable[[], bytes]) -> None:
         """Handle output stream.
         
         Args:
-            read_func: Function to read data
+            fd: File descriptor that becomes readable when output arrives
+            read_func: Function to read available data
         """
-        while not self._closed:
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        
+        def on_readable() -> None:
             try:
                 data = read_func()
-                if data:
-                    await self.write_output(data)
-                else:
-                    await asyncio.sleep(0.01)
             except Exception as e:
-                logger.error(f"Error handling output: {e}")
+                logger.error("Error handling output: %s", e)
+                return
+                
+            # Readable but empty means the stream was closed
+            if not data:
+                loop.remove_reader(fd)
+            chunks.put_nowait(data)
+            
+        loop.add_reader(fd, on_readable)
+        
+        try:
+            while not self._closed:
+                data = await chunks.get()
+                if not data:
+                    break
+                    
+                await self.write_output(data)
+        finally:
+            loop.remove_reader(fd)
                 
     def close(self) -> None:
         """Close I/O manager."""
         self._closed = True
-        self._output_callbacks.clear()
\ No newline at end of file
+        self._output_callbacks = ()
+        
+        # Wake a pending get_input so it can return None
+        self._input_ready.set()
\ No newline at end of file
@@ -1,8 +1,10 @@
 """Pexpect handler for terminal automation."""
 
+import asyncio
+import functools
 import logging
 import re
-from typing import Optional, Union, List
+from typing import Optional, Union, List, Tuple
 
 import pexpect
 
@@ -10,26 +12,67 @@ import pexpect
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_alternation(texts: Tuple[str, ...]) -> re.Pattern:
+    """Compile literals into one pattern with a group per literal.
+    
+    Args:
+        texts: Literal strings, in priority order
+        
+    Returns:
+        Compiled bytes pattern; group i + 1 matches texts[i]
+    """
+    if not texts:
+        # Never matches
+        return re.compile(b"(?!)")
+    return re.compile(b"|".join(b"(" + re.escape(text.encode()) + b")" for text in texts))
+
+
 class PexpectHandler:
     """Handles terminal automation using pexpect."""
     
-    def __init__(self, pty_handler):
+    def __init__(self, pty_handler, max_buffer: int = 65536):
         """Initialize pexpect handler.
         
         Args:
             pty_handler: PTY handler instance
+            max_buffer: Bytes of unmatched output to keep
         """
         self.pty_handler = pty_handler
-        self._buffer = ""
-        self._patterns: List[re.Pattern] = []
+        self.max_buffer = max_buffer
+        # Raw output; only text around a match is ever decoded
+        self._buffer = bytearray()
+        
+        # Length of the buffer already searched by the running expect
+        self._scan_offset = 0
         
-    def send(self, data: str) -> None:
+        # Output preceding the last match, as pexpect's `before`
+        self.before = ""
+        
+        # Output is fed in by the session as it arrives; expect waits on
+        # this instead of polling the PTY
+        self._data_ready = asyncio.Event()
+        
+    def feed(self, data: bytes) -> None:
+        """Add terminal output to the match buffer.
+        
+        Args:
+            data: Raw output bytes
+        """
+        self._buffer.extend(data)
+        excess = len(self._buffer) - self.max_buffer
+        if excess > 0:
+            del self._buffer[:excess]
+            self._scan_offset = max(0, self._scan_offset - excess)
+        self._data_ready.set()
+        
+    def send(self, data: Union[bytes, str]) -> None:
         """Send data to terminal.
         
         Args:
             data: Data to send
         """
-        self.pty_handler.write(data.encode())
+        self.pty_handler.write(data.encode() if isinstance(data, str) else data)
         
     def sendline(self, line: str = "") -> None:
         """Send line to terminal with newline.
@@ -39,13 +82,18 @@ class PexpectHandler:
         """
         self.send(f"{line}\n")
         
-    def expect(
+    async def expect(
         self,
         pattern: Union[str, re.Pattern, List[Union[str, re.Pattern]]],
         timeout: float = 30.0
     ) -> int:
         """Wait for pattern in output.
         
+        Strings are matched literally and only output not yet searched is
+        scanned for them; compiled patterns, including RE2 patterns, are
+        searched over the whole buffer as they are, and so must be bytes
+        patterns.
+        
         Args:
             pattern: Pattern(s) to match
             timeout: Timeout in seconds
@@ -57,43 +105,78 @@ class PexpectHandler:
             TimeoutError: If pattern not found within timeout
         """
         # Convert patterns to list
-        if isinstance(pattern, (str, re.Pattern)):
+        if not isinstance(pattern, (list, tuple)):
             patterns = [pattern]
         else:
             patterns = pattern
             
-        # Compile string patterns
-        compiled_patterns = []
-        for p in patterns:
-            if isinstance(p, str):
-                compiled_patterns.append(re.compile(re.escape(p)))
-            else:
-                compiled_patterns.append(p)
-                
+        # Encode literals once; the buffer holds raw bytes
+        literals = [p.encode() if isinstance(p, str) else None for p in patterns]
+        
         # Wait for match
-        import time
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            # Read more data
-            new_data = self.pty_handler.read()
-            if new_data:
-                self._buffer += new_data
-                
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._scan_offset = 0
+        
+        while True:
+            buffer = self._buffer
+            
             # Check patterns
-            for i, pattern in enumerate(compiled_patterns):
-                match = pattern.search(self._buffer)
-                if match:
-                    # Clear buffer up to match
-                    self._buffer = self._buffer[match.end():]
+            for i, p in enumerate(patterns):
+                if isinstance(p, str):
+                    # A literal can only newly match if it overlaps the
+                    # unsearched tail, so resume just before it
+                    needle = literals[i]
+                    start = max(0, self._scan_offset - len(needle) + 1)
+                    start = buffer.find(needle, start)
+                    end = start + len(needle)
+                else:
+                    match = p.search(buffer)
+                    start, end = match.span() if match else (-1, -1)
+                    
+                if start >= 0:
+                    self._consume(start, end)
                     return i
                     
-            # Small delay to avoid busy loop
-            time.sleep(0.1)
+            self._scan_offset = len(buffer)
+            await self._wait_for_output(loop, deadline, timeout)
             
-        raise TimeoutError(f"Pattern not found within {timeout} seconds")
+    def _consume(self, start: int, end: int) -> None:
+        """Drop output up to the end of a match, keeping what preceded it.
+        
+        Args:
+            start: Start offset of the match
+            end: End offset of the match
+        """
+        self.before = self._buffer[:start].decode("utf-8", errors="replace")
+        del self._buffer[:end]
+        self._scan_offset = 0
         
-    def expect_exact(
+    async def _wait_for_output(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        deadline: float,
+        timeout: float
+    ) -> None:
+        """Sleep until more output is fed in.
+        
+        Args:
+            loop: Running event loop
+            deadline: Event loop time at which to give up
+            timeout: Original timeout, for the error message
+            
+        Raises:
+            TimeoutError: If the deadline passes first
+        """
+        self._data_ready.clear()
+        try:
+            await asyncio.wait_for(self._data_ready.wait(), deadline - loop.time())
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Pattern not found within {timeout} seconds"
+            ) from None
+        
+    async def expect_exact(
         self,
         pattern_list: List[str],
         timeout: float = 30.0
@@ -105,40 +188,62 @@ class PexpectHandler:
             timeout: Timeout in seconds
             
         Returns:
-            Index of matched pattern
+            Index of the earliest match; ties go to the earlier pattern
+            
+        Raises:
+            TimeoutError: If no pattern is found within timeout
         """
-        # Use exact string matching
-        patterns = [re.compile(re.escape(p)) for p in pattern_list]
-        return self.expect(patterns, timeout)
+        # One pass over the buffer finds whichever literal occurs first
+        texts = tuple(pattern_list)
+        joined = _compile_alternation(texts)
+        longest = max((len(text.encode()) for text in texts), default=0)
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        self._scan_offset = 0
+        
+        while True:
+            buffer = self._buffer
+            match = joined.search(buffer, max(0, self._scan_offset - longest + 1))
+            if match:
+                self._consume(*match.span())
+                return match.lastindex - 1
+                
+            self._scan_offset = len(buffer)
+            await self._wait_for_output(loop, deadline, timeout)
         
-    def send_command(
+    async def send_command(
         self,
         command: str,
         expect_prompt: bool = True,
-        prompt: str = "$"
+        prompt: Union[str, re.Pattern] = "$",
+        timeout: float = 30.0
     ) -> str:
         """Send command and wait for completion.
         
         Args:
             command: Command to execute
             expect_prompt: Whether to wait for prompt
-            prompt: Prompt pattern to wait for
+            prompt: Literal prompt, or a compiled bytes pattern built once by
+                the caller, as for expect
+            timeout: Timeout in seconds for the prompt
             
         Returns:
-            Command output
+            Command output, up to the prompt when waiting for one
         """
         # Clear buffer
-        self._buffer = ""
+        self._buffer.clear()
         
         # Send command
         self.sendline(command)
         
         if expect_prompt:
             # Wait for prompt
-            self.expect(prompt)
+            await self.expect(prompt, timeout)
+            return self.before
             
         # Return captured output
-        return self._buffer
+        return self._buffer.decode("utf-8", errors="replace")
         
     def interact(self) -> None:
         """Enter interactive mode (not implemented for containers)."""
@@ -147,5 +252,4 @@ class PexpectHandler:
     def close(self) -> None:
         """Close pexpect handler."""
         # Clear buffer
-        self._buffer = ""
-        self._patterns.clear()
\ No newline at end of file
+        self._buffer.clear()
\ No newline at end of file
@@ -2,7 +2,10 @@
 
 import asyncio
 import logging
-from typing import Optional
+import os
+import socket
+import ssl
+from typing import List, Optional, Union
 
 import dockerpty
 import docker
@@ -14,19 +17,30 @@ logger = logging.getLogger(__name__)
 class PTYHandler:
     """Handles pseudo-terminal allocation for containers."""
     
-    def __init__(self, container_id: str):
+    def __init__(
+        self,
+        container_id: str,
+        client: Optional[docker.DockerClient] = None
+    ):
         """Initialize PTY handler.
         
         Args:
             container_id: Docker container ID
+            client: Optional shared Docker client
         """
         self.container_id = container_id
-        self.client = docker.from_env()
+        self.client = client or docker.from_env()
         self.container = self.client.containers.get(container_id)
         self._stdin = None
         self._stdout = None
         self._stderr = None
         self._connected = False
+        self._exec_id: Optional[str] = None
+        self._socket = None
+        self._fd = -1
+        self.selectable = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._unsent = bytearray()
         
     async def connect(self, command: Optional[str] = None) -> None:
         """Connect to container PTY.
@@ -40,18 +54,18 @@ class PTYHandler:
             
             # Use dockerpty to create PTY
             # Note: dockerpty.start_exec is synchronous, so we run it in executor
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
+            self._loop = asyncio.get_running_loop()
+            await self._loop.run_in_executor(
                 None,
                 self._connect_sync,
                 exec_command
             )
             
             self._connected = True
-            logger.info(f"Connected PTY to container {self.container_id}")
+            logger.info("Connected PTY to container %s", self.container_id)
             
         except Exception as e:
-            logger.error(f"Failed to connect PTY: {e}")
+            logger.error("Failed to connect PTY: %s", e)
             raise
             
     def _connect_sync(self, command: str) -> None:
@@ -60,91 +74,189 @@ class PTYHandler:
         Args:
             command: Command to execute
         """
-        # For now, we'll use docker exec API directly
-        # In production, dockerpty.start_exec would be used
-        exec_instance = self.container.exec_run(
+        # Create and start the exec with the low-level API, as exec_run does,
+        # so the exec ID is known for resizing
+        api = self.client.api
+        exec_instance = api.exec_create(
+            self.container.id,
             command,
             stdin=True,
             stdout=True,
             stderr=True,
-            tty=True,
-            stream=True,
-            socket=True
+            tty=True
         )
+        self._exec_id = exec_instance["Id"]
+        output = api.exec_start(self._exec_id, tty=True, socket=True)
         
-        self._socket = exec_instance.output
+        # docker-py may hand back a SocketIO wrapper; use the socket itself
+        self._socket = getattr(output, "_sock", output)
         
-    async def read(self, size: int = 4096) -> str:
+        # A plain socket is read and written straight from the event loop.
+        # A TLS socket buffers decrypted data the selector cannot see, so it
+        # stays blocking and is read from the executor instead.
+        self._fd = self._socket.fileno()
+        self.selectable = (
+            isinstance(self._socket, socket.socket)
+            and not isinstance(self._socket, ssl.SSLSocket)
+        )
+        if self.selectable:
+            self._socket.setblocking(False)
+        
+    async def read(self, size: int = 4096) -> bytes:
         """Read data from PTY.
         
         Args:
             size: Maximum bytes to read
             
         Returns:
-            Data as string
+            Raw bytes, decoded by whoever consumes them
         """
         if not self._connected:
-            return ""
+            return b""
             
         try:
-            loop = asyncio.get_event_loop()
-            data = await loop.run_in_executor(
-                None,
-                self._socket.recv,
-                size
-            )
+            loop = self._loop
+            if self.selectable:
+                return await loop.sock_recv(self._socket, size)
+                
+            # Fallback for TLS connections: a blocking recv in the executor
+            data = await loop.run_in_executor(None, self._socket.recv, size)
+            return data or b""
             
-            if data:
-                return data.decode("utf-8", errors="replace")
-            return ""
+        except OSError as e:
+            logger.error("Error reading from PTY: %s", e)
+            return b""
             
-        except Exception as e:
-            logger.error(f"Error reading from PTY: {e}")
-            return ""
+    def fileno(self) -> int:
+        """Get the file descriptor of the PTY socket.
+        
+        Returns:
+            File descriptor, usable with loop.add_reader
+        """
+        return self._fd
+        
+    def read_into(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Drain data that is already available on the PTY into a buffer.
+        
+        Only call this once the descriptor is readable, e.g. from an
+        add_reader callback, and only on a selectable handler.
+        Reads take whatever is already queued, until the buffer is full.
+        
+        Args:
+            buffer: Writable buffer to fill
+            
+        Returns:
+            Number of bytes read, 0 once the PTY is closed
+            
+        Raises:
+            BlockingIOError: If nothing was queued after all
+        """
+        if not self._connected:
+            return 0
+            
+        total = 0
+        try:
+            with memoryview(buffer) as view:
+                while total < len(view):
+                    try:
+                        size = os.readv(self._fd, [view[total:]])
+                    except BlockingIOError:
+                        if not total:
+                            raise
+                        break
+                    if not size:
+                        break
+                    total += size
+        except BlockingIOError:
+            raise
+        except OSError as e:
+            logger.error("Error reading from PTY: %s", e)
+            
+        return total
             
-    def write(self, data: bytes) -> None:
-        """Write data to PTY.
+    def write(self, data: Union[bytes, List[bytes]]) -> None:
+        """Write data to PTY without blocking.
+        
+        Whatever the PTY does not take right away is sent once the
+        descriptor is writable again, in order with later writes.
         
         Args:
-            data: Data to write
+            data: Data to write, or several chunks to write with one syscall
         """
         if not self._connected:
             return
             
+        chunks = data if isinstance(data, list) else [data]
+        
+        if not self.selectable:
+            try:
+                self._socket.sendall(b"".join(chunks))
+            except OSError as e:
+                logger.error("Error writing to PTY: %s", e)
+            return
+            
+        # Keep ordering behind anything still waiting to be sent
+        if self._unsent:
+            self._unsent.extend(b"".join(chunks))
+            return
+            
         try:
-            self._socket.send(data)
-        except Exception as e:
-            logger.error(f"Error writing to PTY: {e}")
+            written = os.writev(self._fd, chunks)
+        except BlockingIOError:
+            written = 0
+        except OSError as e:
+            logger.error("Error writing to PTY: %s", e)
+            return
             
-    def resize(self, rows: int, cols: int) -> None:
+        # A short write leaves the tail of the batch to send
+        if written < sum(map(len, chunks)):
+            self._unsent.extend(memoryview(b"".join(chunks))[written:])
+            self._loop.add_writer(self._fd, self._flush_unsent)
+            
+    def _flush_unsent(self) -> None:
+        """Send queued input once the PTY is writable."""
+        try:
+            written = os.write(self._fd, self._unsent)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            logger.error("Error writing to PTY: %s", e)
+            written = len(self._unsent)
+            
+        del self._unsent[:written]
+        if not self._unsent:
+            self._loop.remove_writer(self._fd)
+            
+    def resize(self, rows: int, cols: int) -> bool:
         """Resize terminal.
         
         Args:
             rows: Number of rows
             cols: Number of columns
+            
+        Returns:
+            True if the PTY was resized
         """
-        try:
-            # Docker API resize
-            exec_info = self.container.client.api.exec_inspect(
-                self.container.attrs["ExecIDs"][0]
-            )
+        if not self._exec_id:
+            return False
             
-            if exec_info["Running"]:
-                self.container.client.api.exec_resize(
-                    exec_info["ID"],
-                    height=rows,
-                    width=cols
-                )
-                
+        try:
+            self.client.api.exec_resize(self._exec_id, height=rows, width=cols)
+            return True
         except Exception as e:
-            logger.error(f"Error resizing PTY: {e}")
+            logger.error("Error resizing PTY: %s", e)
+            return False
             
     def close(self) -> None:
         """Close PTY connection."""
+        if self._unsent:
+            self._loop.remove_writer(self._fd)
+            self._unsent.clear()
+            
         if self._socket:
             try:
                 self._socket.close()
             except Exception as e:
-                logger.error(f"Error closing PTY: {e}")
+                logger.error("Error closing PTY: %s", e)
                 
         self._connected = False
\ No newline at end of file
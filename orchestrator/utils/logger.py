@@ -4,7 +4,67 @@ import logging
 import logging.handlers
 import os
 import sys
-from typing import Optional
+import time
+from typing import Optional, Tuple
+
+import orjson
+
+
+class JSONFormatter(logging.Formatter):
+    """Formats log records as single-line JSON objects."""
+    
+    def __init__(self):
+        """Initialize JSON formatter."""
+        super().__init__()
+        # (whole second, formatted date and time) of the last record
+        self._time_cache: Tuple[int, str] = (-1, "")
+        
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, reusing the date and time within a second.
+        
+        Args:
+            record: Log record
+            datefmt: Ignored; the default format is always used
+            
+        Returns:
+            Formatted timestamp
+        """
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(record.created))
+            self._time_cache = (second, text)
+            
+        # Same output as default_msec_format, without %-formatting per record
+        return f"{text},{int(record.msecs):03d}"
+        
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a log record.
+        
+        Args:
+            record: Log record
+            
+        Returns:
+            JSON line
+        """
+        log_obj = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+        }
+        
+        if record.exc_info:
+            # Cached on the record, as logging.Formatter does, so every
+            # handler sharing it formats the traceback once
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_obj["exception"] = record.exc_text
+            
+        return orjson.dumps(log_obj).decode()
 
 
 def setup_logging(
@@ -28,25 +88,6 @@ def setup_logging(
     
     # Create formatters
     if log_format == "json":
-        import json
-        
-        class JSONFormatter(logging.Formatter):
-            def format(self, record):
-                log_obj = {
-                    "timestamp": self.formatTime(record),
-                    "level": record.levelname,
-                    "logger": record.name,
-                    "message": record.getMessage(),
-                    "module": record.module,
-                    "function": record.funcName,
-                    "line": record.lineno,
-                }
-                
-                if record.exc_info:
-                    log_obj["exception"] = self.formatException(record.exc_info)
-                    
-                return json.dumps(log_obj)
-                
         formatter = JSONFormatter()
     else:
         formatter = logging.Formatter(
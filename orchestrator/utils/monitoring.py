@@ -1,15 +1,42 @@
 """Resource monitoring utilities."""
 
 import asyncio
+import functools
+import itertools
 import logging
 import psutil
-from datetime import datetime
+import time
+from collections import deque
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _iso_second(second: int) -> str:
+    """Format a whole UTC second, reused by samples within that second.
+    
+    Args:
+        second: Seconds since the epoch
+        
+    Returns:
+        ISO 8601 date and time without fraction or offset
+    """
+    return datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+
+
+def _utc_timestamp() -> str:
+    """Get the current UTC time in ISO 8601 format.
+    
+    Returns:
+        Timestamp with microseconds, as datetime.isoformat() gives them
+    """
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{_iso_second(second)}.{nanos // 1000:06d}"
+
+
 class ResourceMonitor:
     """Monitors system and container resources."""
     
@@ -22,10 +49,17 @@ class ResourceMonitor:
         self.interval = interval
         self._monitoring = False
         self._current_stats: Dict[str, Any] = {}
-        self._history: list[Dict[str, Any]] = []
         self._max_history = 100
+        self._history: deque[Dict[str, Any]] = deque(maxlen=self._max_history)
         self._monitor_task: Optional[asyncio.Task] = None
         
+        # CPU percentages are measured since the previous call, so prime
+        # them once here instead of sleeping inside every sample
+        self._process = psutil.Process()
+        self._cpu_count = psutil.cpu_count()
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent(interval=None)
+        
     async def start_monitoring(self) -> None:
         """Start resource monitoring."""
         if not self._monitoring:
@@ -49,13 +83,12 @@ class ResourceMonitor:
         """Main monitoring loop."""
         while self._monitoring:
             try:
-                stats = self._collect_stats()
+                # psutil reads /proc, so sample off the event loop
+                stats = await asyncio.to_thread(self._collect_stats)
                 self._current_stats = stats
                 
                 # Add to history
                 self._history.append(stats)
-                if len(self._history) > self._max_history:
-                    self._history.pop(0)
                     
                 await asyncio.sleep(self.interval)
                 
@@ -73,8 +106,8 @@ class ResourceMonitor:
         """
         try:
             # CPU stats
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
+            cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_count = self._cpu_count
             
             # Memory stats
             memory = psutil.virtual_memory()
@@ -94,12 +127,11 @@ class ResourceMonitor:
             net_recv = net_io.bytes_recv
             
             # Process stats
-            process = psutil.Process()
-            process_memory = process.memory_info().rss
-            process_cpu = process.cpu_percent()
+            process_memory = self._process.memory_info().rss
+            process_cpu = self._process.cpu_percent(interval=None)
             
             return {
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _utc_timestamp(),
                 "cpu": {
                     "percent": cpu_percent,
                     "count": cpu_count,
@@ -146,8 +178,10 @@ class ResourceMonitor:
             List of historical statistics
         """
         if limit:
-            return self._history[-limit:]
-        return self._history
+            # Copy only the tail instead of the whole history
+            skip = max(0, len(self._history) - limit)
+            return list(itertools.islice(self._history, skip, None))
+        return list(self._history)
         
     def check_resource_limits(
         self,
@@ -13,7 +13,10 @@ from orchestrator.core.session_manager import SessionManager
 
 @pytest.fixture
 def mock_docker_client():
-    """Mock Docker client for testing."""
+    """Mock Docker client for testing.
+    
+    Kept per test, since tests reconfigure its return values and side effects.
+    """
     client = Mock(spec=docker.DockerClient)
     
     # Mock container
@@ -34,18 +37,33 @@ def mock_docker_client():
     client.containers.get.return_value = container
     client.containers.list.return_value = [container]
     
+    # Low-level API
+    client.api = Mock()
+    client.api.containers.return_value = [{
+        "Id": "test-container-123",
+        "Names": ["/test-container"],
+        "Image": "python:3.9-slim",
+        "ImageID": "sha256:3c1f",
+        "State": "running",
+        "Created": 1704067200
+    }]
+    client.api.images.return_value = [
+        {"Id": "sha256:3c1f", "RepoTags": ["python:3.9-slim"]},
+        {"Id": "sha256:9e0a", "RepoTags": ["<none>:<none>"]}
+    ]
+    
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_client():
-    """FastAPI test client."""
+    """FastAPI test client, shared by the whole run."""
     return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_container_config():
-    """Sample container configuration for tests."""
+    """Sample container configuration for tests, shared and read-only."""
     return ContainerConfig(
         name="test-container",
         image="python:3.9-slim",
@@ -56,9 +74,9 @@ def sample_container_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_orchestrator_config():
-    """Sample orchestrator configuration."""
+    """Sample orchestrator configuration, shared and read-only."""
     return OrchestratorConfig(
         api_host="0.0.0.0",
         api_port=8000,
@@ -68,12 +86,17 @@ def sample_orchestrator_config():
     )
 
 
+@pytest.fixture(scope="session")
+def empty_config_dir(tmp_path_factory):
+    """Empty config directory, shared and read-only."""
+    return tmp_path_factory.mktemp("empty")
+
+
 @pytest.fixture
 def mock_container_manager(mock_docker_client):
     """Mock container manager."""
-    manager = ContainerManager()
-    manager.client = mock_docker_client
-    return manager
+    # Handing the mock in skips building a real DockerClient per test
+    return ContainerManager(client=mock_docker_client)
 
 
 @pytest.fixture
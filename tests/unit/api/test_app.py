@@ -1,19 +1,30 @@
 """Unit tests for FastAPI application."""
 
+import threading
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, Mock, AsyncMock
+from unittest.mock import Mock
 
 from orchestrator.api.app import app
+from orchestrator.api.dependencies import get_orchestrator
 
 
 class TestApp:
     """Test cases for main FastAPI application."""
     
     @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
+    def client(self, test_client):
+        """Use the shared test client."""
+        return test_client
+        
+    @pytest.fixture
+    def mock_orchestrator(self):
+        """Inject a mock orchestrator into the routes."""
+        mock_orchestrator = Mock()
+        app.dependency_overrides[get_orchestrator] = lambda: mock_orchestrator
+        yield mock_orchestrator
+        app.dependency_overrides.pop(get_orchestrator, None)
         
     def test_root_endpoint(self, client):
         """Test root endpoint."""
@@ -25,29 +36,28 @@ class TestApp:
         assert data["version"] == "0.1.0"
         assert data["status"] == "running"
         
-    def test_health_endpoint(self, client):
+    def test_health_endpoint(self, client, mock_orchestrator):
         """Test health check endpoint."""
-        with patch("orchestrator.api.app.orchestrator") as mock_orchestrator:
-            mock_orchestrator.get_system_stats.return_value = {
-                "orchestrator": {
-                    "running": True,
-                    "sessions": 5,
-                    "max_sessions": 50
-                },
-                "system": {
-                    "cpu": {"percent": 25.0},
-                    "memory": {"percent": 45.0}
-                }
+        mock_orchestrator.get_system_stats.return_value = {
+            "orchestrator": {
+                "running": True,
+                "sessions": 5,
+                "max_sessions": 50
+            },
+            "system": {
+                "cpu": {"percent": 25.0},
+                "memory": {"percent": 45.0}
             }
-            
-            response = client.get("/health")
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["status"] == "healthy"
-            assert "orchestrator" in data
-            assert "system" in data
-            
+        }
+        
+        response = client.get("/health")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert "orchestrator" in data
+        assert "system" in data
+        
     def test_cors_headers(self, client):
         """Test CORS headers are present."""
         response = client.options("/")
@@ -56,51 +66,66 @@ class TestApp:
         assert "access-control-allow-methods" in response.headers
         
     @pytest.mark.asyncio
-    async def test_websocket_connection_no_session(self):
+    async def test_websocket_connection_no_session(self, client, mock_orchestrator):
         """Test WebSocket connection with invalid session."""
-        with TestClient(app) as client:
-            with patch("orchestrator.api.app.orchestrator") as mock_orchestrator:
-                mock_orchestrator.session_manager.get_session.return_value = None
-                
-                with client.websocket_connect("/ws/invalid-session") as websocket:
-                    data = websocket.receive_json()
-                    assert data["type"] == "error"
-                    assert "not found" in data["message"]
-                    
+        mock_orchestrator.session_manager.get_session.return_value = None
+        
+        with client.websocket_connect("/ws/invalid-session") as websocket:
+            data = orjson.loads(websocket.receive_bytes())
+            assert data["type"] == "error"
+            assert "not found" in data["message"]
+            
     @pytest.mark.asyncio
-    async def test_websocket_input_handling(self):
+    async def test_websocket_input_handling(self, client, mock_orchestrator):
         """Test WebSocket input handling."""
-        with TestClient(app) as client:
-            with patch("orchestrator.api.app.orchestrator") as mock_orchestrator:
-                # Mock session
-                mock_session = Mock()
-                mock_session.send_input = Mock()
-                mock_session.resize = Mock()
-                mock_session.add_output_callback = Mock()
-                mock_session.remove_output_callback = Mock()
-                
-                mock_orchestrator.session_manager.get_session.return_value = mock_session
+        # Mock session
+        # The server handles messages on its own thread; these are set once
+        # it got to them
+        input_sent = threading.Event()
+        resized = threading.Event()
+        mock_session = Mock()
+        mock_session.send_input = Mock(side_effect=lambda *args: input_sent.set())
+        mock_session.resize = Mock(side_effect=lambda *args: resized.set())
+        mock_session.add_output_callback = Mock()
+        mock_session.remove_output_callback = Mock()
+        
+        mock_orchestrator.session_manager.get_session.return_value = mock_session
+        
+        with client.websocket_connect("/ws/test-session") as websocket:
+            # Send input
+            websocket.send_json({
+                "type": "input",
+                "data": "test command"
+            })
+            
+            assert input_sent.wait(timeout=1.0)
+            mock_session.send_input.assert_called_with("test command")
+            
+            # Send resize
+            websocket.send_json({
+                "type": "resize",
+                "rows": 24,
+                "cols": 80
+            })
+            
+            assert resized.wait(timeout=1.0)
+            mock_session.resize.assert_called_with(24, 80)
+            
+    @pytest.mark.asyncio
+    async def test_websocket_cleanup_on_error(self, client, mock_orchestrator):
+        """Test the output callback is removed when a handler fails."""
+        removed = threading.Event()
+        mock_session = Mock()
+        mock_session.remove_output_callback = Mock(side_effect=lambda *args: removed.set())
+        
+        mock_orchestrator.session_manager.get_session.return_value = mock_session
+        
+        with pytest.raises(KeyError):
+            with client.websocket_connect("/ws/test-session") as websocket:
+                # Input without data makes the handler raise
+                websocket.send_json({"type": "input"})
+                websocket.receive_bytes()
                 
-                with client.websocket_connect("/ws/test-session") as websocket:
-                    # Send input
-                    websocket.send_json({
-                        "type": "input",
-                        "data": "test command"
-                    })
-                    
-                    # Allow some time for processing
-                    import time
-                    time.sleep(0.1)
-                    
-                    mock_session.send_input.assert_called_with("test command")
-                    
-                    # Send resize
-                    websocket.send_json({
-                        "type": "resize",
-                        "rows": 24,
-                        "cols": 80
-                    })
-                    
-                    time.sleep(0.1)
-                    
-                    mock_session.resize.assert_called_with(24, 80)
\ No newline at end of file
+        assert removed.wait(timeout=1.0)
+        callback = mock_session.add_output_callback.call_args[0][0]
+        mock_session.remove_output_callback.assert_called_once_with(callback)
\ No newline at end of file
@@ -1,13 +1,62 @@
 """Unit tests for ConfigLoader."""
 
-import pytest
-import json
-import tempfile
+import os
 from pathlib import Path
 
+import orjson
+import pytest
+
 from orchestrator.core.config_loader import ConfigLoader, ContainerConfig, OrchestratorConfig
 
 
+# Every ContainerConfig field set, for the validation test
+_FULL_CONTAINER_FIELDS = {
+    "name": "full-test",
+    "image": "ubuntu:22.04",
+    "command": "/bin/bash",
+    "volumes": ["/host:/container"],
+    "environment": {"KEY": "value"},
+    "working_dir": "/app",
+    "ports": {"8080": 80},
+    "privileged": True,
+    "readonly": True,
+    "resources": {"memory": "512m"},
+}
+
+
+@pytest.fixture(scope="module")
+def config_dir(tmp_path_factory):
+    """Config tree shared by the read-only tests of this module."""
+    root = tmp_path_factory.mktemp("configs")
+    containers_dir = root / "containers"
+    containers_dir.mkdir()
+    
+    (root / "orchestrator.json").write_bytes(orjson.dumps({
+        "api_host": "127.0.0.1",
+        "api_port": 9000,
+        "max_sessions": 100,
+        "log_level": "DEBUG"
+    }))
+    (containers_dir / "python.json").write_bytes(orjson.dumps({
+        "name": "python-dev",
+        "image": "python:3.9-slim",
+        "command": "/bin/bash",
+        "volumes": ["./workspace:/workspace"]
+    }))
+    (containers_dir / "node.json").write_bytes(orjson.dumps({
+        "name": "node-dev",
+        "image": "node:16",
+        "command": "/bin/bash",
+        "environment": {"NODE_ENV": "development"}
+    }))
+    (containers_dir / "test.json").write_bytes(orjson.dumps({
+        "name": "test-container",
+        "image": "ubuntu:22.04"
+    }))
+    
+    return root
+
+
 class TestConfigLoader:
     """Test cases for ConfigLoader."""
     
@@ -21,146 +70,109 @@ class TestConfigLoader:
         loader = ConfigLoader("/custom/path")
         assert loader.config_dir == Path("/custom/path")
         
-    def test_load_orchestrator_config_default(self):
+    def test_load_orchestrator_config_default(self, empty_config_dir):
         """Test loading orchestrator config with defaults."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            loader = ConfigLoader(tmpdir)
-            config = loader.load_orchestrator_config()
-            
-            assert isinstance(config, OrchestratorConfig)
-            assert config.api_host == "0.0.0.0"
-            assert config.api_port == 8000
-            assert config.max_sessions == 50
-            
-    def test_load_orchestrator_config_from_file(self):
+        loader = ConfigLoader(str(empty_config_dir))
+        config = loader.load_orchestrator_config()
+        
+        assert isinstance(config, OrchestratorConfig)
+        assert config.api_host == "0.0.0.0"
+        assert config.api_port == 8000
+        assert config.max_sessions == 50
+        
+    def test_load_orchestrator_config_from_file(self, config_dir):
         """Test loading orchestrator config from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_data = {
-                "api_host": "127.0.0.1",
-                "api_port": 9000,
-                "max_sessions": 100,
-                "log_level": "DEBUG"
-            }
-            
-            config_file = Path(tmpdir) / "orchestrator.json"
-            with open(config_file, "w") as f:
-                json.dump(config_data, f)
-                
-            loader = ConfigLoader(tmpdir)
-            config = loader.load_orchestrator_config()
-            
-            assert config.api_host == "127.0.0.1"
-            assert config.api_port == 9000
-            assert config.max_sessions == 100
-            assert config.log_level == "DEBUG"
-            
-    def test_load_container_configs(self):
+        loader = ConfigLoader(str(config_dir))
+        config = loader.load_orchestrator_config()
+        
+        assert config.api_host == "127.0.0.1"
+        assert config.api_port == 9000
+        assert config.max_sessions == 100
+        assert config.log_level == "DEBUG"
+        
+    def test_load_orchestrator_config_cached(self, tmp_path):
+        """Test that an unchanged orchestrator config is parsed once."""
+        config_file = tmp_path / "orchestrator.json"
+        config_file.write_bytes(orjson.dumps({"api_port": 9000}))
+        # Old enough to be trusted despite coarse timestamps
+        os.utime(config_file, (1, 1))
+        
+        loader = ConfigLoader(str(tmp_path))
+        config = loader.load_orchestrator_config()
+        
+        assert loader.load_orchestrator_config() is config
+        
+        # An explicit reload parses the file again
+        loader.reload_configs()
+        assert loader.load_orchestrator_config() is not config
+        
+    def test_load_container_configs(self, config_dir):
         """Test loading container configurations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            containers_dir = Path(tmpdir) / "containers"
-            containers_dir.mkdir()
-            
-            # Create test container configs
-            python_config = {
-                "name": "python-dev",
-                "image": "python:3.9-slim",
-                "command": "/bin/bash",
-                "volumes": ["./workspace:/workspace"]
-            }
-            
-            node_config = {
-                "name": "node-dev",
-                "image": "node:16",
-                "command": "/bin/bash",
-                "environment": {"NODE_ENV": "development"}
-            }
-            
-            with open(containers_dir / "python.json", "w") as f:
-                json.dump(python_config, f)
-                
-            with open(containers_dir / "node.json", "w") as f:
-                json.dump(node_config, f)
-                
-            loader = ConfigLoader(tmpdir)
-            configs = loader.load_container_configs()
-            
-            assert len(configs) == 2
-            assert "python-dev" in configs
-            assert "node-dev" in configs
-            
-            python = configs["python-dev"]
-            assert python.image == "python:3.9-slim"
-            assert python.volumes == ["./workspace:/workspace"]
-            
-            node = configs["node-dev"]
-            assert node.image == "node:16"
-            assert node.environment == {"NODE_ENV": "development"}
-            
-    def test_load_container_configs_empty_dir(self):
+        loader = ConfigLoader(str(config_dir))
+        configs = loader.load_container_configs()
+        
+        assert len(configs) == 3
+        assert "python-dev" in configs
+        assert "node-dev" in configs
+        assert "test-container" in configs
+        
+        python = configs["python-dev"]
+        assert python.image == "python:3.9-slim"
+        assert python.volumes == ["./workspace:/workspace"]
+        
+        node = configs["node-dev"]
+        assert node.image == "node:16"
+        assert node.environment == {"NODE_ENV": "development"}
+        
+    def test_load_container_configs_empty_dir(self, empty_config_dir):
         """Test loading container configs from empty directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            loader = ConfigLoader(tmpdir)
-            configs = loader.load_container_configs()
-            assert configs == {}
-            
-    def test_get_container_config(self):
+        loader = ConfigLoader(str(empty_config_dir))
+        configs = loader.load_container_configs()
+        assert configs == {}
+        
+    def test_get_container_config(self, config_dir):
         """Test getting specific container configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            containers_dir = Path(tmpdir) / "containers"
-            containers_dir.mkdir()
-            
-            config_data = {
-                "name": "test-container",
-                "image": "ubuntu:22.04"
-            }
-            
-            with open(containers_dir / "test.json", "w") as f:
-                json.dump(config_data, f)
-                
-            loader = ConfigLoader(tmpdir)
-            config = loader.get_container_config("test-container")
-            
-            assert config is not None
-            assert config.name == "test-container"
-            assert config.image == "ubuntu:22.04"
-            
-    def test_get_container_config_not_found(self):
+        loader = ConfigLoader(str(config_dir))
+        config = loader.get_container_config("test-container")
+        
+        assert config is not None
+        assert config.name == "test-container"
+        assert config.image == "ubuntu:22.04"
+        
+    def test_get_container_config_not_found(self, empty_config_dir):
         """Test getting non-existent container config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            loader = ConfigLoader(tmpdir)
-            config = loader.get_container_config("nonexistent")
-            assert config is None
-            
-    def test_reload_configs(self):
+        loader = ConfigLoader(str(empty_config_dir))
+        config = loader.get_container_config("nonexistent")
+        assert config is None
+        
+    def test_reload_configs(self, tmp_path):
         """Test reloading configurations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            containers_dir = Path(tmpdir) / "containers"
-            containers_dir.mkdir()
-            
-            # Initial config
-            config_data = {
-                "name": "test-container",
-                "image": "python:3.8"
-            }
-            
-            config_file = containers_dir / "test.json"
-            with open(config_file, "w") as f:
-                json.dump(config_data, f)
-                
-            loader = ConfigLoader(tmpdir)
-            loader.load_container_configs()
-            
-            # Update config
-            config_data["image"] = "python:3.9"
-            with open(config_file, "w") as f:
-                json.dump(config_data, f)
-                
-            # Reload
-            loader.reload_configs()
-            config = loader.get_container_config("test-container")
-            
-            assert config.image == "python:3.9"
-            
+        # Rewrites its config, so it gets a directory of its own
+        containers_dir = tmp_path / "containers"
+        containers_dir.mkdir()
+        
+        # Initial config
+        config_data = {
+            "name": "test-container",
+            "image": "python:3.8"
+        }
+        
+        config_file = containers_dir / "test.json"
+        config_file.write_bytes(orjson.dumps(config_data))
+        
+        loader = ConfigLoader(str(tmp_path))
+        loader.load_container_configs()
+        
+        # Update config
+        config_data["image"] = "python:3.9"
+        config_file.write_bytes(orjson.dumps(config_data))
+        
+        # Reload
+        loader.reload_configs()
+        config = loader.get_container_config("test-container")
+        
+        assert config.image == "python:3.9"
+        
     def test_container_config_validation(self):
         """Test ContainerConfig model validation."""
         # Valid config
@@ -173,18 +185,7 @@ class TestConfigLoader:
         assert config.privileged is False
         
         # Config with all fields
-        config = ContainerConfig(
-            name="full-test",
-            image="ubuntu:22.04",
-            command="/bin/bash",
-            volumes=["/host:/container"],
-            environment={"KEY": "value"},
-            working_dir="/app",
-            ports={"8080": 80},
-            privileged=True,
-            readonly=True,
-            resources={"memory": "512m"}
-        )
+        config = ContainerConfig(**_FULL_CONTAINER_FIELDS)
         
         assert config.privileged is True
         assert config.readonly is True
@@ -1,16 +1,49 @@
 """Unit tests for ContainerManager."""
 
+import threading
+import types
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from docker.errors import NotFound, APIError
 
-from orchestrator.core.container_manager import ContainerManager
-from orchestrator.core.config_loader import ContainerConfig
+from orchestrator.core.container_manager import ContainerManager, _iter_stats
+
+
+# One raw stats sample, built once and read-only
+_STATS_SAMPLE = types.MappingProxyType({
+    "cpu_stats": {
+        "cpu_usage": {"total_usage": 1000},
+        "system_cpu_usage": 2000
+    },
+    "precpu_stats": {
+        "cpu_usage": {"total_usage": 500},
+        "system_cpu_usage": 1000
+    },
+    "memory_stats": {
+        "usage": 100 * 1024 * 1024,
+        "limit": 512 * 1024 * 1024
+    },
+    "networks": {
+        "eth0": {
+            "rx_bytes": 1000,
+            "tx_bytes": 2000
+        },
+        "eth1": {
+            "rx_bytes": 10,
+            "tx_bytes": 20
+        }
+    }
+})
 
 
 class TestContainerManager:
     """Test cases for ContainerManager."""
     
+    @pytest.fixture
+    def container(self, mock_container_manager):
+        """The canonical container the mock client already returns."""
+        return mock_container_manager.client.containers.get.return_value
+        
     def test_init(self, mock_docker_client):
         """Test ContainerManager initialization."""
         with patch("docker.DockerClient", return_value=mock_docker_client):
@@ -26,16 +59,15 @@ class TestContainerManager:
         assert container_id in mock_container_manager.containers
         mock_container_manager.client.containers.create.assert_called_once()
         
-    def test_create_container_with_resources(self, mock_container_manager):
+    def test_create_container_with_resources(self, mock_container_manager, sample_container_config):
         """Test container creation with resource limits."""
-        config = ContainerConfig(
-            name="resource-test",
-            image="python:3.9",
-            resources={
+        config = sample_container_config.model_copy(update={
+            "name": "resource-test",
+            "resources": {
                 "memory": "512m",
                 "cpu_shares": 1024
             }
-        )
+        })
         
         mock_container_manager.create_container(config)
         
@@ -50,13 +82,10 @@ class TestContainerManager:
         with pytest.raises(APIError):
             mock_container_manager.create_container(sample_container_config)
             
-    def test_stop_container(self, mock_container_manager):
+    def test_stop_container(self, mock_container_manager, container):
         """Test stopping a running container."""
         # Add container to tracking
-        container = Mock()
-        container.stop = MagicMock()
         mock_container_manager.containers["test-123"] = container
-        mock_container_manager.client.containers.get.return_value = container
         
         result = mock_container_manager.stop_container("test-123")
         
@@ -70,12 +99,9 @@ class TestContainerManager:
         result = mock_container_manager.stop_container("nonexistent")
         assert result is False
         
-    def test_remove_container(self, mock_container_manager):
+    def test_remove_container(self, mock_container_manager, container):
         """Test removing a container."""
-        container = Mock()
-        container.remove = MagicMock()
         mock_container_manager.containers["test-123"] = container
-        mock_container_manager.client.containers.get.return_value = container
         
         result = mock_container_manager.remove_container("test-123")
         
@@ -83,37 +109,18 @@ class TestContainerManager:
         assert "test-123" not in mock_container_manager.containers
         container.remove.assert_called_once_with(force=False)
         
-    def test_get_container_stats(self, mock_container_manager):
+    def test_get_container_stats(self, mock_container_manager, container):
         """Test getting container statistics."""
-        container = Mock()
-        container.stats.return_value = {
-            "cpu_stats": {
-                "cpu_usage": {"total_usage": 1000},
-                "system_cpu_usage": 2000
-            },
-            "precpu_stats": {
-                "cpu_usage": {"total_usage": 500},
-                "system_cpu_usage": 1000
-            },
-            "memory_stats": {
-                "usage": 100 * 1024 * 1024,
-                "limit": 512 * 1024 * 1024
-            },
-            "networks": {
-                "eth0": {
-                    "rx_bytes": 1000,
-                    "tx_bytes": 2000
-                }
-            }
-        }
+        container.stats.return_value = _STATS_SAMPLE
         
-        mock_container_manager.client.containers.get.return_value = container
         stats = mock_container_manager.get_container_stats("test-123")
         
         assert "cpu_percent" in stats
         assert "memory_usage" in stats
         assert "memory_percent" in stats
         assert stats["memory_usage"] == 100 * 1024 * 1024
+        assert stats["network_rx"] == 1010
+        assert stats["network_tx"] == 2020
         
     def test_list_containers(self, mock_container_manager):
         """Test listing containers."""
@@ -122,13 +129,208 @@ class TestContainerManager:
         assert len(containers) == 1
         assert containers[0]["id"] == "test-container-123"
         assert containers[0]["name"] == "test-container"
-        mock_container_manager.client.containers.list.assert_called_once_with(all=True)
+        assert containers[0]["image"] == "python:3.9-slim"
+        assert containers[0]["created"] == "2024-01-01T00:00:00Z"
+        mock_container_manager.client.api.containers.assert_called_once_with(all=True)
         
-    def test_get_container_logs(self, mock_container_manager):
-        """Test getting container logs."""
+    def test_list_containers_untagged_image(self, mock_container_manager):
+        """Test that an untagged image is reported by its ID."""
+        entry = mock_container_manager.client.api.containers.return_value[0]
+        entry["ImageID"] = "sha256:9e0a"
+        
+        containers = mock_container_manager.list_containers(all=True)
+        
+        assert containers[0]["image"] == "sha256:9e0a"
+        
+    def test_list_containers_refreshes_status(self, mock_container_manager):
+        """Test that a relisted container keeps its summary but updates status."""
+        mock_container_manager.list_containers(all=True)
+        summary = mock_container_manager._summaries["test-container-123"]
+        
+        entry = mock_container_manager.client.api.containers.return_value[0]
+        entry["State"] = "exited"
+        mock_container_manager._list_cache.clear()
+        containers = mock_container_manager.list_containers(all=True)
+        
+        assert containers[0]["status"] == "exited"
+        assert mock_container_manager._summaries["test-container-123"] is summary
+        
+    def test_count_running(self, mock_container_manager, sample_container_config):
+        """Test that the running count is tracked without relisting."""
+        assert mock_container_manager.count_running() == 1
+        mock_container_manager.client.api.containers.assert_called_once_with(all=False)
+        
+        mock_container_manager.stop_container("test-container-123")
+        assert mock_container_manager.count_running() == 0
+        
+        mock_container_manager.create_container(sample_container_config)
+        assert mock_container_manager.count_running() == 1
+        mock_container_manager.client.api.containers.assert_called_once()
+        
+    def test_start_and_restart_update_running(self, mock_container_manager, container):
+        """Test that start and restart keep the cached listing current."""
+        mock_container_manager.containers["test-container-123"] = container
+        assert mock_container_manager.count_running() == 1
+        mock_container_manager.stop_container("test-container-123")
+        assert mock_container_manager.count_running() == 0
+        
+        with patch("orchestrator.core.container_manager.threading.Thread"):
+            assert mock_container_manager.start_container("test-container-123") is True
+            assert mock_container_manager.count_running() == 1
+            
+            mock_container_manager.list_containers()
+            assert mock_container_manager.restart_container("test-container-123") is True
+            
+        container.start.assert_called_once_with()
+        container.restart.assert_called_once_with(timeout=10)
+        assert mock_container_manager._list_cache == {}
+        assert mock_container_manager.count_running() == 1
+        
+    def test_get_container_logs_from_follower(self, mock_container_manager):
+        """Test that followed containers serve logs from their ring."""
+        served = []
+        
+        def stream():
+            yield b"2024-01-01T00:00:00Z zero\n2024-01-01T00:00:01Z o"
+            yield b"ne\r\n2024-01-01T00:00:02Z two\n"
+            served.append(
+                mock_container_manager.get_container_logs("test-123", tail=2, timestamps=False)
+            )
+            
         container = Mock()
+        container.id = "test-123"
+        container.logs.return_value = stream()
+        stop = threading.Event()
+        mock_container_manager._log_followers["test-123"] = stop
+        
+        mock_container_manager._follow_logs(container, stop)
+        
+        assert served == ["one\ntwo\n"]
+        mock_container_manager.client.containers.get.assert_not_called()
+        
+        # The stream ended on its own, so the ring is no longer served
+        assert "test-123" not in mock_container_manager._log_rings
+        
+    def test_log_ring_published_after_first_read(self, mock_container_manager):
+        """Test that a follower's ring is not served before the backlog."""
+        published = []
+        
+        def stream():
+            published.append("test-123" in mock_container_manager._log_rings)
+            yield b"2024-01-01T00:00:00Z zero\n"
+            published.append("test-123" in mock_container_manager._log_rings)
+            
+        container = Mock()
+        container.id = "test-123"
+        container.logs.return_value = stream()
+        stop = threading.Event()
+        mock_container_manager._log_followers["test-123"] = stop
+        
+        mock_container_manager._follow_logs(container, stop)
+        
+        assert published == [False, True]
+        
+    def test_stop_log_follower_closes_stream(self, mock_container_manager):
+        """Test that stopping a follower closes its log stream."""
+        stream = Mock()
+        mock_container_manager._log_followers["test-123"] = threading.Event()
+        mock_container_manager._log_streams["test-123"] = stream
+        
+        mock_container_manager._stop_log_follower("test-123")
+        
+        stream.close.assert_called_once()
+        assert "test-123" not in mock_container_manager._log_streams
+        
+    def test_log_streams_are_capped(self, mock_container_manager):
+        """Test that the oldest log follower is retired at the cap."""
+        mock_container_manager._max_log_streams = 2
+        
+        with patch("orchestrator.core.container_manager.threading.Thread"):
+            for container_id in ("a", "b", "c"):
+                container = Mock()
+                container.id = container_id
+                mock_container_manager._start_log_follower(container)
+                
+        assert list(mock_container_manager._log_followers) == ["b", "c"]
+        
+    def test_log_streams_capped_across_threads(self, mock_container_manager):
+        """Test that followers started concurrently never exceed the cap."""
+        mock_container_manager._max_log_streams = 4
+        barrier = threading.Barrier(16)
+        
+        def start(container_id):
+            container = Mock()
+            container.id = container_id
+            barrier.wait()
+            mock_container_manager._start_log_follower(container)
+            
+        with patch.object(ContainerManager, "_follow_logs"):
+            threads = [threading.Thread(target=start, args=(str(i),)) for i in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+                
+        assert len(mock_container_manager._log_followers) == 4
+        
+    def test_stats_streams_are_capped(self, mock_container_manager):
+        """Test that the oldest stats stream is retired at the cap."""
+        mock_container_manager._max_stats_streams = 2
+        
+        with patch("orchestrator.core.container_manager.threading.Thread"):
+            for container_id in ("a", "b", "c"):
+                container = Mock()
+                container.id = container_id
+                mock_container_manager._start_stats_reader(container)
+                
+        assert list(mock_container_manager._stats_readers) == ["b", "c"]
+        
+    def test_stats_streams_capped_across_threads(self, mock_container_manager):
+        """Test that readers started concurrently never exceed the cap."""
+        mock_container_manager._max_stats_streams = 4
+        barrier = threading.Barrier(16)
+        
+        def start(container_id):
+            container = Mock()
+            container.id = container_id
+            barrier.wait()
+            mock_container_manager._start_stats_reader(container)
+            
+        with patch.object(ContainerManager, "_read_stats"):
+            threads = [threading.Thread(target=start, args=(str(i),)) for i in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+                
+        assert len(mock_container_manager._stats_readers) == 4
+        
+    def test_destroy_event_drops_container(self, mock_container_manager):
+        """Test that a destroy event clears the cached container state."""
+        mock_container_manager.list_containers(all=True)
+        mock_container_manager.containers["test-container-123"] = Mock()
+        
+        mock_container_manager._apply_event("destroy", "test-container-123")
+        
+        assert "test-container-123" not in mock_container_manager.containers
+        assert "test-container-123" not in mock_container_manager._summaries
+        assert mock_container_manager.count_running() == 0
+        assert mock_container_manager._list_cache == {}
+        
+    def test_iter_stats_splits_frames(self):
+        """Test parsing raw stats frames that don't line up with chunks."""
+        chunks = [
+            b'{"cpu_stats": {"a": 1}, "blkio_stats": {}}\n{"memory',
+            b'_stats": {"usage": 2}}\n',
+        ]
+        
+        samples = list(_iter_stats(chunks))
+        
+        assert samples == [{"cpu_stats": {"a": 1}}, {"memory_stats": {"usage": 2}}]
+        
+    def test_get_container_logs(self, mock_container_manager, container):
+        """Test getting container logs."""
         container.logs.return_value = "test log output"
-        mock_container_manager.client.containers.get.return_value = container
         
         logs = mock_container_manager.get_container_logs("test-123", tail=50)
         
@@ -1,76 +1,119 @@
 """Unit tests for SessionManager."""
 
+import os
+import threading
 import pytest
 import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, NonCallableMock, patch, AsyncMock
 
-from orchestrator.core.session_manager import SessionManager, Session
+from orchestrator.core.session_manager import RESIZE_DEBOUNCE, SessionManager, Session
 
 
 class TestSession:
     """Test cases for Session class."""
     
-    def test_session_init(self, mock_pty_handler, mock_pexpect_handler):
-        """Test Session initialization."""
-        session = Session(
+    @pytest.fixture
+    def session(self, mock_pty_handler, mock_pexpect_handler):
+        """Session with a pexpect handler."""
+        return Session(
             session_id="test-123",
             container_id="container-456",
             pty_handler=mock_pty_handler,
             pexpect_handler=mock_pexpect_handler
         )
         
+    @pytest.fixture
+    def pty_session(self, mock_pty_handler):
+        """Session writing straight to the PTY."""
+        return Session(
+            session_id="test-123",
+            container_id="container-456",
+            pty_handler=mock_pty_handler
+        )
+        
+    def test_session_init(self, session, mock_pty_handler, mock_pexpect_handler):
+        """Test Session initialization."""
         assert session.session_id == "test-123"
         assert session.container_id == "container-456"
         assert session.pty_handler == mock_pty_handler
         assert session.pexpect_handler == mock_pexpect_handler
         assert session.active is True
-        assert isinstance(session.created_at, datetime)
+        assert isinstance(session.created_at, float)
         
-    def test_send_input_with_pexpect(self, mock_pty_handler, mock_pexpect_handler):
+    def test_send_input_with_pexpect(self, session, mock_pexpect_handler):
         """Test sending input with pexpect handler."""
-        session = Session(
-            session_id="test-123",
-            container_id="container-456",
-            pty_handler=mock_pty_handler,
-            pexpect_handler=mock_pexpect_handler
-        )
-        
         session.send_input("test command")
         mock_pexpect_handler.send.assert_called_once_with("test command")
         
-    def test_send_input_without_pexpect(self, mock_pty_handler):
+    @pytest.mark.parametrize("data,written", [
+        ("test command", b"test command"),
+        # Queued chunks reach the PTY in a single write
+        (["ls", b" -la", "\n"], [b"ls", b" -la", b"\n"]),
+    ], ids=["text", "batch"])
+    def test_send_input_without_pexpect(self, pty_session, mock_pty_handler, data, written):
         """Test sending input without pexpect handler."""
-        session = Session(
-            session_id="test-123",
-            container_id="container-456",
-            pty_handler=mock_pty_handler,
-            pexpect_handler=None
-        )
+        pty_session.send_input(data)
+        mock_pty_handler.write.assert_called_once_with(written)
         
-        session.send_input("test command")
-        mock_pty_handler.write.assert_called_once_with(b"test command")
+    def test_send_input_bytes_passthrough(self, pty_session, mock_pty_handler):
+        """Test that bytes input reaches the PTY as is, without re-encoding."""
+        data = b"raw"
+        pty_session.send_input(data)
+        assert mock_pty_handler.write.call_args[0][0] is data
         
-    def test_resize(self, mock_pty_handler):
+    def test_resize(self, pty_session, mock_pty_handler):
         """Test terminal resize."""
-        session = Session(
-            session_id="test-123",
-            container_id="container-456",
-            pty_handler=mock_pty_handler
-        )
+        pty_session.resize(24, 80)
+        mock_pty_handler.resize.assert_called_once_with(24, 80)
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resize_debounced(self, pty_session, mock_pty_handler):
+        """Test that a burst of resizes applies only the latest size."""
+        for cols in range(80, 90):
+            pty_session.resize(24, cols)
+        mock_pty_handler.resize.assert_not_called()
         
-        session.resize(24, 80)
+        await asyncio.sleep(RESIZE_DEBOUNCE * 2)
+        mock_pty_handler.resize.assert_called_once_with(24, 89)
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resize_failure_logged(self, pty_session, mock_pty_handler, caplog):
+        """Test that a failed resize is logged rather than dropped."""
+        mock_pty_handler.resize.side_effect = RuntimeError("gone")
+        
+        pty_session.resize(24, 80)
+        await asyncio.sleep(RESIZE_DEBOUNCE * 2)
+        
+        assert "Error resizing session" in caplog.text
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_resize_one_at_a_time(self, pty_session, mock_pty_handler):
+        """Test that a resize requested mid-flight is sent after, never alongside."""
+        release = threading.Event()
+        
+        def resize(rows, cols):
+            release.wait(timeout=1.0)
+            return True
+            
+        mock_pty_handler.resize.side_effect = resize
+        
+        pty_session.resize(24, 80)
+        await asyncio.sleep(RESIZE_DEBOUNCE * 2)
+        pty_session.resize(30, 100)
+        await asyncio.sleep(RESIZE_DEBOUNCE * 2)
         mock_pty_handler.resize.assert_called_once_with(24, 80)
         
-    def test_close(self, mock_pty_handler, mock_pexpect_handler):
-        """Test session close."""
-        session = Session(
-            session_id="test-123",
-            container_id="container-456",
-            pty_handler=mock_pty_handler,
-            pexpect_handler=mock_pexpect_handler
-        )
+        release.set()
+        await asyncio.sleep(RESIZE_DEBOUNCE)
+        mock_pty_handler.resize.assert_called_with(30, 100)
+        
+        # A repeat of the applied size is dropped before reaching a thread
+        pty_session.resize(30, 100)
+        await asyncio.sleep(RESIZE_DEBOUNCE * 2)
+        assert mock_pty_handler.resize.call_count == 2
         
+    def test_close(self, session, mock_pty_handler, mock_pexpect_handler):
+        """Test session close."""
         session.close()
         
         assert session.active is False
@@ -81,11 +124,21 @@ class TestSession:
 class TestSessionManager:
     """Test cases for SessionManager."""
     
-    @pytest.mark.asyncio
+    @pytest.fixture
+    def session_mock(self):
+        """Stand-in session limited to the Session API."""
+        return NonCallableMock(spec=Session)
+        
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_session(self, mock_session_manager):
         """Test creating a terminal session."""
+        read_fd, write_fd = os.pipe()
+        
         with patch("orchestrator.core.session_manager.PTYHandler") as mock_pty_class:
-            mock_pty = AsyncMock()
+            # Only connect is a coroutine; close and the rest are synchronous
+            mock_pty = Mock()
+            mock_pty.connect = AsyncMock()
+            mock_pty.fileno = Mock(return_value=read_fd)
             mock_pty_class.return_value = mock_pty
             
             session_id = await mock_session_manager.create_session("container-123")
@@ -94,7 +147,12 @@ class TestSessionManager:
             assert len(mock_session_manager.sessions) == 1
             mock_pty.connect.assert_called_once()
             
-    @pytest.mark.asyncio
+            mock_session_manager.close_session(session_id)
+            
+        os.close(read_fd)
+        os.close(write_fd)
+            
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_create_session_max_limit(self, mock_session_manager):
         """Test session creation when max limit reached."""
         # Fill up sessions
@@ -104,9 +162,9 @@ class TestSessionManager:
         with pytest.raises(RuntimeError, match="Maximum sessions"):
             await mock_session_manager.create_session("container-123")
             
-    def test_get_session(self, mock_session_manager):
+    def test_get_session(self, mock_session_manager, session_mock):
         """Test getting session by ID."""
-        mock_session = Mock()
+        mock_session = session_mock
         mock_session_manager.sessions["test-123"] = mock_session
         
         session = mock_session_manager.get_session("test-123")
@@ -115,9 +173,9 @@ class TestSessionManager:
         # Test non-existent session
         assert mock_session_manager.get_session("nonexistent") is None
         
-    def test_close_session(self, mock_session_manager):
+    def test_close_session(self, mock_session_manager, session_mock):
         """Test closing a session."""
-        mock_session = Mock()
+        mock_session = session_mock
         mock_session_manager.sessions["test-123"] = mock_session
         
         result = mock_session_manager.close_session("test-123")
@@ -155,24 +213,43 @@ class TestSessionManager:
         assert sessions[0]["session_id"] == "session-1"
         assert sessions[1]["session_id"] == "session-2"
         
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_cleanup_loop(self, mock_session_manager):
         """Test cleanup of timed out sessions."""
+        mock_session_manager.clock = lambda: 10000.0
+        
         # Create an old session
-        old_session = Mock()
-        old_session.last_activity = datetime.utcnow() - timedelta(hours=2)
+        old_session = NonCallableMock(spec=Session)
+        old_session.last_activity = 10000.0 - 2 * 3600
         mock_session_manager.sessions["old-session"] = old_session
         
         # Create a recent session
-        new_session = Mock()
-        new_session.last_activity = datetime.utcnow()
+        new_session = NonCallableMock(spec=Session)
+        new_session.last_activity = 9999.0
         mock_session_manager.sessions["new-session"] = new_session
         
+        # Create a session that was idle when queued but active since
+        revived_session = NonCallableMock(spec=Session)
+        revived_session.last_activity = 9999.0
+        mock_session_manager.sessions["revived-session"] = revived_session
+        
+        mock_session_manager._activity_heap = [
+            (10000.0 - 3 * 3600, "revived-session"),
+            (old_session.last_activity, "old-session"),
+            (new_session.last_activity, "new-session"),
+        ]
+        
         # Mock close_session
         mock_session_manager.close_session = Mock()
         
         # Run one iteration of cleanup
-        await mock_session_manager._cleanup_loop()
+        mock_session_manager._expire_sessions()
         
         # Only old session should be closed
-        mock_session_manager.close_session.assert_called_once_with("old-session")
\ No newline at end of file
+        mock_session_manager.close_session.assert_called_once_with("old-session")
+        
+        # Both live sessions stay queued, the revived one at its new activity
+        assert sorted(mock_session_manager._activity_heap) == sorted([
+            (revived_session.last_activity, "revived-session"),
+            (new_session.last_activity, "new-session"),
+        ])
\ No newline at end of file
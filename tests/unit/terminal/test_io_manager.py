@@ -0,0 +1,43 @@
+"""Unit tests for IOManager."""
+
+import pytest
+
+from orchestrator.terminal.io_manager import IOManager
+
+
+class TestIOManager:
+    """Test cases for the IOManager output ring."""
+    
+    @pytest.fixture
+    def io_manager(self):
+        """Manager with a small ring."""
+        return IOManager(buffer_size=8)
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_write_wraps(self, io_manager):
+        """Test a write that wraps around the end of the ring."""
+        await io_manager.write_output(b"abcdef")
+        await io_manager.write_output(b"ghij")
+        
+        assert io_manager.get_output_buffer() == b"cdefghij"
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_write_larger_than_capacity(self, io_manager):
+        """Test that an oversized write keeps only its tail."""
+        await io_manager.write_output(b"ab")
+        await io_manager.write_output(b"0123456789")
+        
+        assert io_manager.get_output_buffer() == b"23456789"
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_read_after_overwrite(self, io_manager):
+        """Test reading lines once older output has been overwritten."""
+        await io_manager.write_output(b"one\ntwo\n")
+        await io_manager.write_output(b"six\n")
+        
+        assert io_manager.get_output_buffer() == b"two\nsix\n"
+        assert io_manager.get_output_buffer(lines=1, as_str=True) == "six\n"
+        
+        # Writes continue from the wrapped head
+        await io_manager.write_output(b"ten")
+        assert io_manager.get_output_buffer() == b"\nsix\nten"
\ No newline at end of file
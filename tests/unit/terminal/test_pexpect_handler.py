@@ -0,0 +1,55 @@
+"""Unit tests for PexpectHandler."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from orchestrator.terminal.pexpect_handler import PexpectHandler
+
+
+class TestPexpectHandler:
+    """Test cases for PexpectHandler."""
+    
+    @pytest.fixture
+    def handler(self):
+        """Handler over a stand-in PTY."""
+        return PexpectHandler(Mock(), max_buffer=16)
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_expect_across_feeds(self, handler):
+        """Test a literal split over two chunks of output."""
+        handler.feed(b"output: do")
+        waiter = asyncio.create_task(handler.expect(["missing", "done"], timeout=1.0))
+        await asyncio.sleep(0)
+        handler.feed(b"ne\n")
+        
+        assert await waiter == 1
+        assert handler.before == "output: "
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_expect_across_trim(self, handler):
+        """Test a literal whose start is shifted by trimming the buffer."""
+        handler.feed(b"0123456789ab-ne")
+        waiter = asyncio.create_task(handler.expect("needle", timeout=1.0))
+        await asyncio.sleep(0)
+        # Overflows max_buffer, dropping the first four bytes
+        handler.feed(b"edle!")
+        
+        assert await waiter == 0
+        assert handler.before == "456789ab-"
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_expect_exact_prefix(self, handler):
+        """Test that a later literal that prefixes an earlier one loses the tie."""
+        handler.feed(b"> abcd")
+        
+        assert await handler.expect_exact(["abcd", "ab"], timeout=1.0) == 0
+        assert handler.before == "> "
+        
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_expect_timeout(self, handler):
+        """Test that expect gives up once the timeout passes."""
+        handler.feed(b"nothing here")
+        
+        with pytest.raises(TimeoutError):
+            await handler.expect("prompt", timeout=0.01)
\ No newline at end of file